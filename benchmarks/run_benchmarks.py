@@ -0,0 +1,262 @@
+"""
+Benchmark suite for NOViZ
+
+Measures
+ - create_array throughput (frames per second) of every algorithm on every objective function
+ - cost of scalar, fused value and gradient (value_and_grad) and batch evaluation of every objective function
+ - cost of BufferArray.push and BufferArray.__getitem__
+ - memory per frame of a BufferArray
+
+and writes the results as JSON. If a baseline file exists, every result is compared with it and
+regressions beyond the threshold are reported (exit code 1). Timings on a shared machine vary a lot from
+run to run, so a baseline is the median of several runs (1 + --retries) and regressions are measured
+again and only reported if the best of all runs is still beyond the threshold.
+
+usage (from repository root):
+    python benchmarks/run_benchmarks.py                       # compare with benchmarks/baseline.json
+    python benchmarks/run_benchmarks.py --output bench.json   # additionally write results
+    python benchmarks/run_benchmarks.py --save-baseline       # store results as new baseline
+"""
+
+
+########### IMPORTS ###########
+# <editor-fold desc="Open">
+
+# packages
+import argparse
+import json
+import os
+import platform
+import sys
+import timeit
+import tracemalloc
+import numpy as np
+
+# modules from project
+BENCHMARK_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.join(os.path.dirname(BENCHMARK_DIR), 'code'))
+from optimization import Algorithms
+from optimization.bufferArray import BufferArray
+from objective_functions import ObjectiveFunctions
+
+# </editor-fold>
+########### IMPORTS ###########
+
+
+DEFAULT_BASELINE = os.path.join(BENCHMARK_DIR, 'baseline.json')
+INTERPOLATED_POINTS = [(0.0, 3.0), (1.0, 1.0), (2.0, 2.5), (3.0, 0.5), (4.0, 2.0)]
+
+
+def create_function(name):
+    """
+    :param name: key of objective function in ObjectiveFunctions
+    :return: objective function object with default coefficients and a start point inside its x range
+    """
+    function_object = ObjectiveFunctions[name]
+    if name == "Interpolated":
+        function = function_object(INTERPOLATED_POINTS)
+    else:
+        function = function_object(function_object.get_coeffs_defaults(function_object))
+    y_min, y_max, x_min, x_max = function.get_axes_parameters()
+    return function, x_min + 0.6 * (x_max - x_min)
+
+
+def best_time(statement, number, repeat=5):
+    """
+    :param statement: callable to be timed
+    :param number: number of calls per measurement
+    :param repeat: number of measurements
+    :return: best time of one call in seconds
+    """
+    return min(timeit.repeat(statement, number=number, repeat=repeat)) / number
+
+
+def result(value, unit, higher_is_better):
+    """
+    :return: dictionary of one benchmark result
+    """
+    return {"value": value, "unit": unit, "higher_is_better": higher_is_better}
+
+
+def bench_create_array():
+    """
+    :return: create_array throughput of every algorithm on every objective function
+    """
+    results = {}
+    for method_name, method_object in Algorithms.items():
+        params = method_object.get_params_defaults(method_object)
+        for function_name in ObjectiveFunctions:
+            function, startpoint = create_function(function_name)
+            algorithms = []
+
+            def create_array():
+                # new algorithm in every repeat, so nothing computed in an earlier repeat is reused. The same
+                # seed gives the same random numbers (and so the same frames) in every repeat
+                algorithm = method_object(function, params, seed=0)
+                algorithm.create_array(startpoint)
+                algorithms.append(algorithm)
+
+            seconds = best_time(create_array, number=1, repeat=5)
+            name = "create_array/{}/{}".format(method_name, function_name)
+            results[name] = result(len(algorithms[-1].array) / seconds, "frames/s", True)
+    return results
+
+
+def bench_evaluation(batch_size=100000, scalar_calls=2000):
+    """
+    :param batch_size: number of x values per batch evaluation
+    :param scalar_calls: number of scalar calls per measurement
+    :return: cost per x value of scalar, value_and_grad and batch evaluation of every objective function
+    """
+    results = {}
+    for function_name in ObjectiveFunctions:
+        function, startpoint = create_function(function_name)
+        y_min, y_max, x_min, x_max = function.get_axes_parameters()
+        # without end points, as some functions are not defined at the border of their x range (e.g. x=0)
+        xs = np.linspace(x_min, x_max, batch_size + 2)[1:-1]
+        scalar = best_time(lambda: function(startpoint), number=scalar_calls)
+        value_and_grad = best_time(lambda: function.value_and_grad(startpoint), number=scalar_calls)
+        batch = best_time(lambda: function.evaluate(xs), number=10) / batch_size
+        results["evaluate/scalar/" + function_name] = result(scalar * 1e9, "ns/value", False)
+        results["evaluate/value_and_grad/" + function_name] = result(value_and_grad * 1e9, "ns/value", False)
+        results["evaluate/batch/" + function_name] = result(batch * 1e9, "ns/value", False)
+    return results
+
+
+def bench_buffer_array(frames=100000):
+    """
+    :param frames: number of frames pushed
+    :return: cost of push and __getitem__ and memory per frame of a buffer array
+    """
+    def fill():
+        array = BufferArray()
+        for i in range(frames):
+            array.push(i % 8, [(i, -i)], None, [(i, 0.0, i + 1, 1.0)], nextpoint=[[(i, 1.0)], 'black'])
+        return array
+
+    push = best_time(fill, number=1, repeat=3) / frames
+    array = fill()
+    getitem = best_time(lambda: [array[i].points for i in range(0, frames, 10)], number=1) / (frames // 10)
+
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    array = fill()
+    array.trim()
+    memory = (tracemalloc.get_traced_memory()[0] - before) / frames
+    tracemalloc.stop()
+
+    return {"buffer_array/push": result(push * 1e9, "ns/frame", False),
+            "buffer_array/getitem": result(getitem * 1e9, "ns/frame", False),
+            "buffer_array/memory": result(memory, "bytes/frame", False)}
+
+
+def run_all():
+    """
+    :return: dictionary with meta information and all benchmark results
+    """
+    benchmarks = {}
+    benchmarks.update(bench_create_array())
+    benchmarks.update(bench_evaluation())
+    benchmarks.update(bench_buffer_array())
+    meta = {"python": platform.python_version(), "numpy": np.__version__, "machine": platform.machine(),
+            "platform": platform.platform()}
+    return {"meta": meta, "benchmarks": benchmarks}
+
+
+def best_of(results, other):
+    """
+    :param results: benchmark results of run_all
+    :param other: benchmark results of another run of run_all
+    :return: results with the better value of both runs for every benchmark
+    """
+    benchmarks = dict(results["benchmarks"])
+    for name, current in other["benchmarks"].items():
+        previous = benchmarks.get(name)
+        if previous is None or (current["value"] > previous["value"]) == current["higher_is_better"]:
+            benchmarks[name] = current
+    return {"meta": results["meta"], "benchmarks": benchmarks}
+
+
+def median_of(runs):
+    """
+    :param runs: list of benchmark results of run_all
+    :return: results with the median value of all runs for every benchmark
+    """
+    benchmarks = {}
+    for name, current in runs[0]["benchmarks"].items():
+        values = [run["benchmarks"][name]["value"] for run in runs if name in run["benchmarks"]]
+        benchmarks[name] = dict(current, value=float(np.median(values)))
+    return {"meta": runs[0]["meta"], "benchmarks": benchmarks}
+
+
+def compare(results, baseline, threshold):
+    """
+    :param results: benchmark results of run_all
+    :param baseline: benchmark results to compare with
+    :param threshold: allowed relative deterioration (0.5 means 50 %)
+    :return: list of regression messages
+    """
+    regressions = []
+    for name, current in results["benchmarks"].items():
+        reference = baseline["benchmarks"].get(name)
+        if reference is None or not reference["value"]:
+            continue
+        change = current["value"] / reference["value"] - 1
+        deterioration = -change if current["higher_is_better"] else change
+        if deterioration > threshold:
+            regressions.append("{}: {:.4g} -> {:.4g} {} ({:+.0%})".format(
+                name, reference["value"], current["value"], current["unit"], change))
+    return regressions
+
+
+def main(argv=None):
+    """
+    command line entry point
+    :param argv: command line arguments without program name (sys.argv[1:] if None)
+    :return: exit code (1 if there are regressions)
+    """
+    parser = argparse.ArgumentParser(description="Runs NOViZ benchmarks")
+    parser.add_argument("--output", help="file to write results to as JSON")
+    parser.add_argument("--baseline", default=DEFAULT_BASELINE, help="baseline JSON file to compare with")
+    parser.add_argument("--threshold", type=float, default=0.5, help="allowed relative deterioration")
+    parser.add_argument("--retries", type=int, default=3, help="additional runs for a baseline (median counts) "
+                                                                "or to confirm regressions (best run counts)")
+    parser.add_argument("--save-baseline", action="store_true", help="write results to baseline file")
+    args = parser.parse_args(argv)
+
+    baseline = None
+    if not args.save_baseline and os.path.exists(args.baseline):
+        with open(args.baseline) as file:
+            baseline = json.load(file)
+
+    results = run_all()
+    if args.save_baseline:
+        results = median_of([results] + [run_all() for retry in range(args.retries)])
+    for retry in range(args.retries):
+        # further runs only to confirm regressions
+        if baseline is None or not compare(results, baseline, args.threshold):
+            break
+        results = best_of(results, run_all())
+    for name, current in sorted(results["benchmarks"].items()):
+        print("{:<60} {:>14.4g} {}".format(name, current["value"], current["unit"]))
+
+    if args.output:
+        with open(args.output, "w") as file:
+            json.dump(results, file, indent=2)
+    if args.save_baseline:
+        with open(args.baseline, "w") as file:
+            json.dump(results, file, indent=2)
+        return 0
+
+    if baseline is not None:
+        regressions = compare(results, baseline, args.threshold)
+        if regressions:
+            print("\nregressions beyond {:.0%}:".format(args.threshold))
+            print("\n".join(regressions))
+            return 1
+        print("\nno regressions beyond {:.0%}".format(args.threshold))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
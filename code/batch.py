@@ -0,0 +1,161 @@
+"""
+Headless batch call for NOViZ
+
+Runs an algorithm on an objective function from one or more start points without the GUI, i.e. without
+importing PyQt5 or matplotlib, and writes the results to disk. Objective functions and algorithms are chosen
+by their names in ObjectiveFunctions and Algorithms, e.g.:
+
+    python batch.py --function "Sinus" --coeffs 1 1 1 1 --method "Gradient Descent" --params 0.01 300
+                    --startpoints -2 0 2 --output results
+
+For every start point a run file run_<i>.noviz is written (see optimization.runStore, can be opened in the GUI),
+summary.json lists all runs.
+Coefficients of "Interpolated" are given as x0 y0 x1 y1 ...
+"""
+
+
+########### IMPORTS ###########
+# <editor-fold desc="Open">
+
+# packages
+import argparse
+import json
+import os
+import sys
+import numpy as np
+
+# modules from project
+from optimization import Algorithms
+from optimization.runStore import save_run, EXTENSION
+from objective_functions import ObjectiveFunctions
+
+# </editor-fold>
+########### IMPORTS ###########
+
+
+class Batch:
+    """
+    Headless counterpart of Main. Creates objective function and algorithm from their names and
+    runs the algorithm for several start points
+    """
+    def __init__(self, function_name, coeffs, method_name, params, seed=None):
+        """
+        init
+        :param function_name: name of objective function in ObjectiveFunctions
+        :param coeffs: objective function coefficients as list (None for defaults)
+        :param method_name: name of algorithm in Algorithms
+        :param params: algorithm parameters as list (None for defaults)
+        :param seed: seed of the random generator of the algorithm, the same for every run (None for not
+            seeded runs, which use the global np.random state)
+        """
+        if function_name not in ObjectiveFunctions:
+            raise ValueError("unknown objective function '{}', choose from: {}".format(
+                function_name, ", ".join(ObjectiveFunctions)))
+        if method_name not in Algorithms:
+            raise ValueError("unknown algorithm '{}', choose from: {}".format(method_name, ", ".join(Algorithms)))
+        self.function_name = function_name
+        self.method_name = method_name
+        self.function_object = ObjectiveFunctions[function_name]
+        self.method_object = Algorithms[method_name]
+        if coeffs is None:
+            coeffs = self.function_object.get_coeffs_defaults(self.function_object)
+        elif function_name == "Interpolated":
+            if len(coeffs) % 2:
+                raise ValueError("Interpolated needs x, y pairs as coefficients, got {} values".format(len(coeffs)))
+            coeffs = [(x, y) for x, y in zip(coeffs[::2], coeffs[1::2])]
+        if params is None:
+            params = self.method_object.get_params_defaults(self.method_object)
+        self.coeffs = coeffs
+        self.params = params
+        self.seed = seed
+
+    def calculate(self, startpoint):
+        """
+        runs the algorithm once
+        :param startpoint: start point as x coordinate
+        :return: algorithm with buffer array computed
+        """
+        algorithm = self.method_object(self.function_object(self.coeffs), self.params, seed=self.seed)
+        algorithm.create_array(startpoint)
+        return algorithm
+
+    def run(self, startpoints, output=None):
+        """
+        runs the algorithm for all start points and writes the results if output is set
+        :param startpoints: list of start points as x coordinates
+        :param output: output directory (None writes nothing)
+        :return: list of summary dictionaries, one per run
+        """
+        if output is not None:
+            os.makedirs(output, exist_ok=True)
+        summary = []
+        for index, startpoint in enumerate(startpoints):
+            algorithm = self.calculate(startpoint)
+            run = self._summarize(algorithm.array, startpoint, algorithm.truncated)
+            if output is not None:
+                run["file"] = "run_{}{}".format(index, EXTENSION)
+                save_run(os.path.join(output, run["file"]), algorithm.array, self.function_name, self.coeffs,
+                         self.method_name, self.params, startpoint, self.seed)
+            summary.append(run)
+        if output is not None:
+            with open(os.path.join(output, "summary.json"), "w") as file:
+                json.dump({"function": self.function_name,
+                           "coeffs": np.asarray(self.coeffs, dtype=float).tolist(),
+                           "method": self.method_name,
+                           "params": [float(param) for param in self.params],
+                           "seed": self.seed,
+                           "runs": summary}, file, indent=2)
+        return summary
+
+    @staticmethod
+    def _summarize(array, startpoint, truncated=False):
+        """
+        :param array: computed buffer array
+        :param startpoint: start point of the run
+        :param truncated: True if the run stopped at the maximal capacity of the buffer array
+        :return: dictionary with start point, number of frames, truncation, last and lowest point
+        """
+        last = array[-1].points if len(array) else None
+        minimum = array.get_minimum()
+        return {"startpoint": float(startpoint),
+                "frames": len(array),
+                "truncated": bool(truncated),
+                "last_point": None if last is None else [float(value) for value in last[0]],
+                "minimum": None if minimum is None else [float(value) for value in minimum]}
+
+
+def parse_args(argv):
+    """
+    :param argv: command line arguments without program name
+    :return: parsed arguments
+    """
+    parser = argparse.ArgumentParser(description="Runs NOViZ algorithms without GUI")
+    parser.add_argument("--function", required=True,
+                        help="objective function, one of: " + ", ".join(ObjectiveFunctions))
+    parser.add_argument("--coeffs", type=float, nargs="+",
+                        help="objective function coefficients (default values if not set)")
+    parser.add_argument("--method", required=True, help="algorithm, one of: " + ", ".join(Algorithms))
+    parser.add_argument("--params", type=float, nargs="+", help="algorithm parameters (default values if not set)")
+    parser.add_argument("--seed", type=int, default=None, help="seed of random generator (not seeded if not set)")
+    parser.add_argument("--startpoints", type=float, nargs="+", default=[2.0], help="start points as x coordinates")
+    parser.add_argument("--output", default=None, help="output directory (results are only printed if not set)")
+    args = parser.parse_args(argv)
+    if args.function == "Interpolated" and args.coeffs is not None and len(args.coeffs) % 2:
+        parser.error("--coeffs of Interpolated are x, y pairs, got an odd number of values ({})".format(
+            len(args.coeffs)))
+    return args
+
+
+def main(argv=None):
+    """
+    command line entry point
+    :param argv: command line arguments without program name (sys.argv[1:] if None)
+    """
+    args = parse_args(sys.argv[1:] if argv is None else argv)
+    batch = Batch(args.function, args.coeffs, args.method, args.params, args.seed)
+    for run in batch.run(args.startpoints, args.output):
+        print(json.dumps(run))
+
+
+if __name__ == "__main__":
+    main()
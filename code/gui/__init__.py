@@ -3,6 +3,7 @@ Module GUI
 Lukas Müller: lukas.mueller-1@studium.uni-hamburg.de
 
 gui: Creates inital GUI in gui
+calculation: background thread computing the buffer array
 guis_functions_parser: passes gui's actions/events/clicks on to corresponding modules/classes in functions_parser
 gui_testing: test classes for gui
 heplful_stuff: helper functions ans misc for gui module
@@ -0,0 +1,89 @@
+"""
+Calculation submodule for GUI.
+
+Computes the buffer array of an algorithm in a background thread, so that the GUI stays responsive
+and already computed frames can be shown (played, scrubbed) while the algorithm is still running.
+"""
+
+
+########### IMPORTS ###########
+# <editor-fold desc="Open">
+
+# packages
+from PyQt5.QtCore import QThread, QTimer, pyqtSignal
+
+# </editor-fold>
+########### IMPORTS ###########
+
+
+class Calculation(QThread):
+    """
+    Thread that runs create_array of an algorithm. The buffer array grows while it runs and frames
+    are only ever appended, so the GUI thread can read all frames up to len(algorithm.array) at any time
+    without a lock: BufferArray.push writes all columns of a frame before it increases the length, and when
+    columns are reallocated the filled frames are copied before the new column replaces the old one (a single
+    attribute assignment, which is atomic under the GIL). Readers have to take len() once and only access
+    frames below that snapshot, as the length may change between two reads.
+    Progress is reported periodically with the signal 'progress' (number of frames, share done).
+    Inherits from QThread
+    """
+    progress = pyqtSignal(int, float)
+
+    def __init__(self, algorithm, startpoint, interval=50, parent=None):
+        """
+        init
+        :param algorithm: algorithm object from optimization.algorithms (buffer array not computed yet).
+            Random numbers are drawn from its own generator (seed of the algorithm), the global np.random
+            state is not touched by the thread
+        :param startpoint: start point as x coordinate
+        :param interval: interval of progress reports in milliseconds
+        :param parent: parent QObject
+        """
+        super(Calculation, self).__init__(parent)
+        self.algorithm = algorithm
+        # cancel request of an earlier run is reset before the thread starts, so a cancel() can't get lost
+        self.algorithm.cancelled = False
+        self.startpoint = startpoint
+        self.error = None
+
+        # progress reports from GUI thread
+        self.timer = QTimer(self)
+        self.timer.setInterval(interval)
+        self.timer.timeout.connect(self._report)
+        self.started.connect(self.timer.start)
+        self.finished.connect(self._finish)
+
+    def run(self):
+        """
+        computes buffer array (runs in background thread)
+        """
+        try:
+            self.algorithm.create_array(self.startpoint)
+        except Exception as error:
+            self.error = error
+
+    def cancel(self):
+        """
+        stops calculation after the current step, frames computed so far are kept
+        """
+        self.algorithm.cancel()
+
+    def frames(self):
+        """
+        :return: number of frames computed so far
+        """
+        array = getattr(self.algorithm, 'array', None)
+        return 0 if array is None else len(array)
+
+    def _report(self):
+        """
+        emits current progress
+        """
+        self.progress.emit(self.frames(), self.algorithm.progress)
+
+    def _finish(self):
+        """
+        stops progress reports after a last one
+        """
+        self.timer.stop()
+        self._report()
@@ -115,6 +115,18 @@ class GuiMain(object):
         self.menu_file_save.setStatusTip('Save current image')
         self.menu_file_save.setObjectName("menu_file_save")
         self.file_menu.addAction(self.menu_file_save)
+        #       open run
+        self.menu_file_open_run = QAction("Open run")
+        self.menu_file_open_run.setShortcut('Ctrl+O')
+        self.menu_file_open_run.setStatusTip('Open a saved run')
+        self.menu_file_open_run.setObjectName("menu_file_open_run")
+        self.file_menu.addAction(self.menu_file_open_run)
+        #       save run
+        self.menu_file_save_run = QAction("Save run")
+        self.menu_file_save_run.setShortcut('Ctrl+Shift+S')
+        self.menu_file_save_run.setStatusTip('Save current run')
+        self.menu_file_save_run.setObjectName("menu_file_save_run")
+        self.file_menu.addAction(self.menu_file_save_run)
         #       exit
         self.menu_file_exit = QAction("Exit")
         self.menu_file_exit.setShortcut('Ctrl+Q')
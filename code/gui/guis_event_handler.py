@@ -16,9 +16,10 @@ visualization.plotcanvas but its instantiation is triggered here.
 
 # packages
 import sip
-from PyQt5.QtWidgets import QMainWindow, QApplication
-from PyQt5.QtCore import Qt, QTimer, QEvent
-from PyQt5.QtGui import QIcon, QPalette, QColor
+import numpy as np
+from PyQt5.QtWidgets import QMainWindow, QApplication, QProgressBar, QPushButton, QFileDialog
+from PyQt5.QtCore import Qt, QEvent
+from PyQt5.QtGui import QIcon, QPalette, QColor, QPixmap
 
 # files from gui
 from .gui import GuiMain
@@ -26,13 +27,16 @@ from .popup_guis_warnings import PopUpWarning, PopUpNotification
 from .popup_guis_meths import PopUpMethods
 from .popup_guis_obj_funcs import PopUpParameterPolynomial, PopUpFunction
 from .popup_guis_settings import PopUpSettings
-from .latex import mathtex_to_qpixmap, MathTexPixmapWidget
+from .latex import mathtex_to_qpixmap, mathtex_to_qimage, prerender_mathtex, MathTexPixmapWidget, load_cache, \
+    save_cache
 from .helpful_stuff import module_dir, _round
+from .calculation import Calculation
 
 # modules from project
-from visualization import CustomNavigationToolbar, PlotCanvas
+from visualization import CustomNavigationToolbar, PlotCanvas, Playback, speed_to_fps
 from objective_functions import ObjectiveFunctions
 from optimization import Algorithms
+from optimization.runStore import save_run, load_run, EXTENSION
 
 # </editor-fold>
 ########### IMPORTS ###########
@@ -60,15 +64,27 @@ class GuiFunctionParser(QMainWindow):
         self.ui = GuiMain()
         self.ui.setupUi(self)
 
+        # rendered latex formulas of last session (if cache file is set)
+        load_cache()
+
         # theme inits
         self._theme_inits()
 
+        # pseudocode of all algorithms is rendered in background
+        self._init_pseudocode()
+
         # function parameter
         self._init_inputs()
 
         # empty plot
         self._init_plot(plotcanvas)
 
+        # play animation scheduler
+        self._init_playback()
+
+        # background calculation
+        self._init_calculation()
+
         # buttons and other gui events
         self._connect_buttons()
         self._connect_spinbox()
@@ -85,6 +101,15 @@ class GuiFunctionParser(QMainWindow):
         # key events
         GuiFunctionParser.installEventFilter(self, self)
 
+    def closeEvent(self, event):
+        """
+        Stops running calculation and saves rendered latex formulas (if cache file is set) on exit
+        :param event: close event
+        """
+        self._cancel_calculation()
+        save_cache()
+        super(GuiFunctionParser, self).closeEvent(event)
+
 #########
 # inits #
 #########
@@ -125,9 +150,44 @@ class GuiFunctionParser(QMainWindow):
         """
         self.PlotCanvas_object = plotcanvas
         self.PlotCanvas_object.spinbox_currentposition = self.ui.spinbox_currentposition
+        self.PlotCanvas_object.mouse_coords.connect(self._update_xy_coords)
         self.ui.verticalLayout_plot_canvas.addWidget(self.PlotCanvas_object)
         self._init_toolbar()
 
+    def _init_playback(self):
+        """
+        Init playback scheduler of play animation, its frame rate is set by speed slider
+        """
+        self.playback = Playback(parent=self)
+        self.playback.advance.connect(self._play_frames)
+        self._speed_control()
+
+    def _init_calculation(self):
+        """
+        Init background calculation and its progress bar and cancel button in status bar
+        """
+        self.calculation = None
+        # function, method, parameters and start point of the shown run (see _menu_save_run)
+        self.run = None
+        self.progressbar = QProgressBar()
+        self.progressbar.setRange(0, 100)
+        self.progressbar.setFixedWidth(150)
+        self.button_cancel = QPushButton("Cancel")
+        self.button_cancel.clicked.connect(self._button_cancel)
+        self.ui.statusbar.addPermanentWidget(self.progressbar)
+        self.ui.statusbar.addPermanentWidget(self.button_cancel)
+        self.progressbar.hide()
+        self.button_cancel.hide()
+
+    def _init_pseudocode(self):
+        """
+        Init pseudocode pixmaps, which are rendered once per (algorithm class, theme) and reused
+        """
+        self.pseudocode_pixmaps = {}
+        # futures of pseudocode lines being rendered in background
+        self.pseudocode_images = {}
+        self._prerender_pseudocode()
+
     def _init_toolbar(self):
         """
         Init custom toolbar
@@ -172,6 +232,8 @@ class GuiFunctionParser(QMainWindow):
         """
         # file menu
         self.ui.menu_file_save.triggered.connect(self.toolbar.save_figure)
+        self.ui.menu_file_open_run.triggered.connect(self._menu_open_run)
+        self.ui.menu_file_save_run.triggered.connect(self._menu_save_run)
         self.ui.menu_file_exit.triggered.connect(self.close)
         # view menu
         self.ui.menu_view_trace.triggered.connect(self._tracing)
@@ -207,8 +269,6 @@ class GuiFunctionParser(QMainWindow):
         self._get_app()
         # main theme
         self._save_palette()
-        # xy coords
-        self._update_xy_coords_timer()
         # init theme mode
         self.normal_theme = True
 
@@ -344,27 +404,46 @@ class GuiFunctionParser(QMainWindow):
     def _button_play_pause(self):
         """
         Is activated when button 'play' in player button menu is clicked.
-        Iterates through play_animation in plotcanvas who's generator returns pseudo code
-        line and player mode information to be passed on to pseudo code label and the buttons icon.
+        Starts the playback scheduler, which advances plotcanvas frame by frame (see _play_frames)
+        until the last frame is reached or the animation is paused.
         Every first click will start (respectively resume) the animation, every second one will pause it
         """
 
         if self.player_mode == "pause" and self.PlotCanvas_object.algorithm is not None and \
-                not self.PlotCanvas_object.algorithm.array.last_position():
+                (not self.PlotCanvas_object.algorithm.array.last_position() or self.calculation is not None):
             self._set_pause_button()
             # assert algorithm already chosen
             if self._button_overhead():
                 self.player_mode = "play"
-                pseudocodeline = self.PlotCanvas_object.algorithm.array().pseudocodeline
-                while pseudocodeline != None and self.player_mode == "play" and \
-                        not self.PlotCanvas_object.algorithm.array.last_position():
-                    # update plot
-                    pseudocodeline = self.PlotCanvas_object.update_one_step("next", play=True)
-                    self.ui.set_pseudocode(pseudocodeline)
+                self.playback.start()
+                return
         elif self.PlotCanvas_object.algorithm is None:
             PopUpWarn = PopUpWarning("Please click calculate first")
             PopUpWarn.exec_()
 
+        self._stop_playback()
+
+    def _play_frames(self, frames):
+        """
+        Is activated by the playback scheduler on every due frame.
+        Proceeds the given number of frames in buffer array and sets corresponding pseudo code line
+        :param frames: number of frames to proceed (more than one if rendering could not keep up)
+        """
+        if self.player_mode != "play" or self.PlotCanvas_object.algorithm is None:
+            self._stop_playback()
+            return
+        pseudocodeline = self.PlotCanvas_object.update_one_step("next", steps=frames)
+        if pseudocodeline is not None:
+            self.ui.set_pseudocode(pseudocodeline)
+        # wait for more frames if calculation is still running
+        if self.calculation is None and self.PlotCanvas_object.algorithm.array.last_position():
+            self._stop_playback()
+
+    def _stop_playback(self):
+        """
+        Stops play animation and sets play button
+        """
+        self.playback.stop()
         self.player_mode = "pause"
         self._set_play_button()
 
@@ -400,52 +479,242 @@ class GuiFunctionParser(QMainWindow):
     def _button_calculate(self):
         """
         Is activated when button 'calculate' is clicked.
-        Gets current selected method and function type from GUI combo boxes and passes them on
-        to plotcanvas object
+        Gets current selected method and function type from GUI combo boxes and starts the calculation
+        of the buffer array in a background thread. The plot is shown as soon as the first frames are computed
+        (see _calculation_progress)
         """
 
         # check if method and function and corresponding parameters are selected
         if self._everything_is_chosen() and self.startpoint:
 
+            # stop running animation and calculation
+            if self.player_mode == "play":
+                self._stop_playback()
+            self._cancel_calculation()
+
             self.PlotCanvas_object.reset_plot()
+            self.PlotCanvas_object.set_algorithm(None)
+            self.function = self.ui.comboBox_function.currentText().replace(" ", "")
 
-            self.PlotCanvas_object.set_algorithm(self.main.calculate(self.function_object,
-                                                                     self.function_parameter,
-                                                                     self.method_object,
-                                                                     self.method_parameter,
-                                                                     self.startpoint))
+            # fresh seed for the random generator of the algorithm, stored so the run can be reproduced
+            seed = int(np.random.SeedSequence().generate_state(1)[0])
+            algorithm = self.main.create_algorithm(self.function_object,
+                                                   self.function_parameter,
+                                                   self.method_object,
+                                                   self.method_parameter,
+                                                   seed)
+            self.calculation = Calculation(algorithm, self.startpoint, parent=self)
+            # everything needed to save (and reproduce) the run later on (see _menu_save_run)
+            self.run = {"function": self.ui.comboBox_function.currentText(),
+                        "coeffs": self.function_parameter,
+                        "method": self.ui.comboBox_method.currentText(),
+                        "params": self.method_parameter,
+                        "startpoint": self.startpoint,
+                        "seed": seed}
+            self.calculation.progress.connect(self._calculation_progress)
+            self.calculation.finished.connect(self._calculation_finished)
+            self.progressbar.setValue(0)
+            self.progressbar.show()
+            self.button_cancel.show()
+            self.calculation.start()
 
-            # pseudocode
-            self.ui.label_animation_pseudocode.table_pseudocode.clear()
+            self.chosing_start_point_forbidden = True
 
-            # cast pseudocode lines onto qlistwidget (with some detours)
-            self._fill_pseudocode_lines()
+        # notify popup
+        else:
+            self.Warning = PopUpWarning("Please choose method, function and according parameters")
+            self.Warning.exec_()
 
-            table_pseudocode_height = len(self.PlotCanvas_object.algorithm.pseudocode) * 35
-            self.ui.label_animation_pseudocode.table_pseudocode.setFixedSize(200, table_pseudocode_height)
+    def _show_calculation(self, algorithm):
+        """
+        Shows first frame of a calculation in plotcanvas and sets pseudo code and spinbox
+        :param algorithm: algorithm whose buffer array is (being) computed
+        """
+        self.PlotCanvas_object.set_algorithm(algorithm)
 
-            if self.PlotCanvas_object.algorithm.scatter:
-                self.PlotCanvas_object.update_figure_scatter_points(None, clear=True)
+        # pseudocode
+        self.ui.label_animation_pseudocode.table_pseudocode.clear()
 
-            # update spinbox und arraylength
-            self.ui.spinbox_currentposition.setValue(1)
-            self.ui.spinbox_currentposition.setMinimum(1)
-            self.ui.spinbox_currentposition.setMaximum(len(self.PlotCanvas_object.algorithm.array))
-            self.ui.label_arraylength.setText('/ ' + str(len(self.PlotCanvas_object.algorithm.array)))
+        # cast pseudocode lines onto qlistwidget (with some detours)
+        self._fill_pseudocode_lines()
 
-            # plot update
-            self.function = self.ui.comboBox_function.currentText().replace(" ", "")
-            self.PlotCanvas_object.set_axes(self.startpoint)
-            self.PlotCanvas_object.update_figure_plot()
-            self.PlotCanvas_object.show_plot()
-            self.ui.verticalLayout_plot_canvas.update()
+        table_pseudocode_height = len(self.PlotCanvas_object.algorithm.pseudocode) * 35
+        self.ui.label_animation_pseudocode.table_pseudocode.setFixedSize(200, table_pseudocode_height)
 
-            self.chosing_start_point_forbidden = True
+        if self.PlotCanvas_object.algorithm.scatter:
+            self.PlotCanvas_object.update_figure_scatter_points(None, clear=True)
 
-        # notify popup
+        # update spinbox und arraylength
+        self.ui.spinbox_currentposition.setValue(1)
+        self.ui.spinbox_currentposition.setMinimum(1)
+        self._update_array_length()
+
+        # plot update
+        self.PlotCanvas_object.set_axes(self.startpoint)
+        self.PlotCanvas_object.update_figure_plot()
+        self.PlotCanvas_object.show_plot()
+        self.ui.verticalLayout_plot_canvas.update()
+
+    def _update_array_length(self):
+        """
+        Sets spinbox maximum and array length label to the number of frames computed so far
+        """
+        # the array may grow in between while a calculation is running, so its length is read once
+        length = len(self.PlotCanvas_object.algorithm.array)
+        self.ui.spinbox_currentposition.setMaximum(length)
+        self.ui.label_arraylength.setText('/ ' + str(length))
+
+    def _calculation_progress(self, frames, progress):
+        """
+        Is activated periodically while a calculation is running.
+        Shows the plot with the first computed frames and afterwards extends spinbox and array length
+        :param frames: number of frames computed so far
+        :param progress: share of calculation done (0 to 1)
+        """
+        if self.sender() is not self.calculation:
+            return
+        self.progressbar.setValue(int(progress * 100))
+        if frames == 0:
+            return
+        if self.PlotCanvas_object.algorithm is not self.calculation.algorithm:
+            self._show_calculation(self.calculation.algorithm)
         else:
-            self.Warning = PopUpWarning("Please choose method, function and according parameters")
+            self._update_array_length()
+
+    def _calculation_finished(self):
+        """
+        Is activated when a calculation is done or cancelled. Hides progress bar and reports errors, cancellation
+        and truncation at the maximal number of frames
+        """
+        calculation = self.sender()
+        calculation.deleteLater()
+        if calculation is not self.calculation:
+            return
+        self.calculation = None
+        self.progressbar.hide()
+        self.button_cancel.hide()
+        if calculation.error is not None:
+            self.Warning = PopUpWarning("Calculation failed: " + str(calculation.error))
+            self.Warning.exec_()
+        elif calculation.algorithm.cancelled:
+            self.ui.statusbar.showMessage("Calculation cancelled after {} frames".format(calculation.frames()), 5000)
+        elif calculation.algorithm.truncated:
+            self.ui.statusbar.showMessage("Calculation stopped at the maximal number of {} frames".format(
+                calculation.frames()), 5000)
+
+    def _menu_open_run(self):
+        """
+        Is activated when menu 'Open run' is clicked. Opens a run file chosen in a file dialog
+        """
+        path, _ = QFileDialog.getOpenFileName(self, "Open run", "", "NOViZ runs (*{})".format(EXTENSION))
+        if path:
+            self.open_run(path)
+
+    def open_run(self, path):
+        """
+        Shows a saved run like a finished calculation. Its frames are memory mapped, i.e. only read from disk
+        when they are shown, so even very long runs can be scrubbed
+        :param path: file path of run file (see optimization.runStore)
+        """
+        try:
+            header, array = load_run(path)
+        except (OSError, ValueError, KeyError) as error:
+            self.Warning = PopUpWarning("Run could not be opened: " + str(error))
+            self.Warning.exec_()
+            return
+        if header["function"] not in ObjectiveFunctions or header["method"] not in Algorithms:
+            self.Warning = PopUpWarning("Run of unknown function or method: {}, {}".format(
+                header["function"], header["method"]))
+            self.Warning.exec_()
+            return
+
+        # stop running animation and calculation
+        if self.player_mode == "play":
+            self._stop_playback()
+        self._cancel_calculation()
+
+        # select function and method of run (without their default parameters and parameter popups)
+        for combobox, name in ((self.ui.comboBox_function, header["function"]),
+                               (self.ui.comboBox_method, header["method"])):
+            combobox.blockSignals(True)
+            combobox.setCurrentText(name)
+            combobox.blockSignals(False)
+        self.function_object = ObjectiveFunctions[header["function"]]
+        self.method_object = Algorithms[header["method"]]
+        self.last_function_chosen = header["function"]
+        self.last_method_chosen = header["method"]
+        if header["function"] == "Interpolated":
+            self.function_parameter = [tuple(point) for point in header["coeffs"]]
+        else:
+            self.function_parameter = header["coeffs"]
+        self.method_parameter = header["params"]
+        self.startpoint = header["startpoint"]
+        self.run = header
+
+        # parameter labels
+        self.function_string_plain = self.function_object.create_formula_string(self.function_object,
+                                                                                self.function_parameter)
+        self.ui.label_function_parameters_show.setPixmap(mathtex_to_qpixmap(
+            self.function_string_plain, normal_theme=self.normal_theme))
+        self.ui.label_method_parameters_show.setText("".join(
+            "{}: {:g}\n".format(param.name, value)
+            for param, value in zip(self.method_object.get_params(self.method_object), self.method_parameter)))
+
+        # show run
+        self._rebuild_plotcanvas()
+        self.function = header["function"].replace(" ", "")
+        algorithm = self.main.create_algorithm(self.function_object,
+                                               self.function_parameter,
+                                               self.method_object,
+                                               self.method_parameter)
+        algorithm.array = array
+        algorithm.progress = 1.0
+        self._show_calculation(algorithm)
+        self.chosing_start_point_forbidden = True
+        self.ui.statusbar.showMessage("Opened run with {} frames".format(len(array)), 5000)
+
+    def _menu_save_run(self):
+        """
+        Is activated when menu 'Save run' is clicked. Saves the shown run to a file chosen in a file dialog
+        """
+        algorithm = self.PlotCanvas_object.algorithm
+        if self.calculation is not None or getattr(algorithm, 'array', None) is None or self.run is None:
+            self.Warning = PopUpWarning("Please calculate a run first (and wait until it is finished)")
+            self.Warning.exec_()
+            return
+        path, _ = QFileDialog.getSaveFileName(self, "Save run", "run" + EXTENSION,
+                                              "NOViZ runs (*{})".format(EXTENSION))
+        if not path:
+            return
+        if not path.endswith(EXTENSION):
+            path += EXTENSION
+        try:
+            save_run(path, algorithm.array, self.run["function"], self.run["coeffs"], self.run["method"],
+                     self.run["params"], self.run["startpoint"], self.run.get("seed"))
+        except OSError as error:
+            self.Warning = PopUpWarning("Run could not be saved: " + str(error))
             self.Warning.exec_()
+            return
+        self.ui.statusbar.showMessage("Saved run to " + path, 5000)
+
+    def _cancel_calculation(self):
+        """
+        Cancels running calculation and waits for it to stop. Its remaining reports are ignored
+        """
+        if self.calculation is not None:
+            self.calculation.cancel()
+            self.calculation.wait()
+            self.calculation = None
+            self.progressbar.hide()
+            self.button_cancel.hide()
+
+    def _button_cancel(self):
+        """
+        Is activated when button 'cancel' in status bar is clicked.
+        Stops running calculation, frames computed so far can still be played
+        """
+        if self.calculation is not None:
+            self.calculation.cancel()
 
     def _button_reset(self):
         """
@@ -453,6 +722,8 @@ class GuiFunctionParser(QMainWindow):
         Resets plotcanvas and pseudo code line to initial state
         """
         if self.player_mode != "play":
+            self._cancel_calculation()
+
             # reset inputs
             self._init_inputs()
 
@@ -682,6 +953,7 @@ class GuiFunctionParser(QMainWindow):
                 self.ui.MainWindow.setWindowIcon(QIcon(module_dir + 'gui_imgs/NoviZ4.png'))
 
             # redraw pseudocode lines
+            self._prerender_pseudocode()
             if self.PlotCanvas_object.algorithm is not None:
                 self._fill_pseudocode_lines()
             # function string color
@@ -912,24 +1184,50 @@ class GuiFunctionParser(QMainWindow):
 
     def _speed_control(self):
         """
-        Converts speed slider value to wait factor which determines the animation speed
+        Converts speed slider value to frames per second of the play animation
         """
-        wait_factor = (100 - self.ui.slider_speed.value()) * 10
-        self.PlotCanvas_object.sleep_time = wait_factor
+        self.playback.fps = speed_to_fps(self.ui.slider_speed.value(), self.ui.slider_speed.maximum())
+        self.ui.slider_speed.setToolTip("{:.3g} frames/s".format(self.playback.fps))
 
     def _speed_window(self):
         """
         Opens speed setting window
         """
         # animation speed setter pop up
-        speed = -(self.PlotCanvas_object.sleep_time / 10 - 100)
+        speed = self.ui.slider_speed.value()
         self.PopUpSpeed = PopUpSettings({"Animation speed": speed}, "Animation speed", 500)
         if self.PopUpSpeed.exec_():
             settings_dict = self.PopUpSpeed.params_dict
             speed = settings_dict["Animation speed"]
-            self.PlotCanvas_object.sleep_time = (100 - speed) * 10
-            # set slider
-            self.ui.slider_speed.setValue(speed)
+            # set slider (which sets frame rate)
+            self.ui.slider_speed.setValue(int(speed))
+
+    def _prerender_pseudocode(self):
+        """
+        Starts rendering the pseudocode lines of all algorithms in current theme in a background thread
+        """
+        for method_object in Algorithms.values():
+            key = (method_object, self.normal_theme)
+            if key not in self.pseudocode_pixmaps and key not in self.pseudocode_images:
+                self.pseudocode_images[key] = prerender_mathtex(method_object.pseudocode, fontsize=8,
+                                                                normal_theme=self.normal_theme)
+
+    def _get_pseudocode_pixmaps(self, method_object):
+        """
+        :param method_object: algorithm class
+        :return: list of QPixmaps of its pseudocode lines in current theme
+        """
+        key = (method_object, self.normal_theme)
+        if key not in self.pseudocode_pixmaps:
+            if key in self.pseudocode_images:
+                # usually done already
+                images = self.pseudocode_images.pop(key).result()
+            else:
+                images = [mathtex_to_qimage(line, fontsize=8, normal_theme=self.normal_theme)
+                          for line in method_object.pseudocode]
+            # QPixmaps can only be created in GUI thread
+            self.pseudocode_pixmaps[key] = [QPixmap.fromImage(image) for image in images]
+        return self.pseudocode_pixmaps[key]
 
     def _fill_pseudocode_lines(self):
         """
@@ -940,8 +1238,8 @@ class GuiFunctionParser(QMainWindow):
         table.setRowCount(num_lines)
 
         i = 0
-        for line in self.PlotCanvas_object.algorithm.pseudocode:
-            tex_line = MathTexPixmapWidget(mathtex_to_qpixmap(line, fontsize=8, normal_theme=self.normal_theme))
+        for pixmap in self._get_pseudocode_pixmaps(type(self.PlotCanvas_object.algorithm)):
+            tex_line = MathTexPixmapWidget(pixmap)
             table.setCellWidget(i, 0, tex_line)
             i += 1
             table.setRowHeight(i, 25)
@@ -986,23 +1284,15 @@ class GuiFunctionParser(QMainWindow):
             self.ui.button_play_pause_icon = QIcon(module_dir + 'gui_imgs/play_dt.png')
         self.ui.button_play_pause.setIcon(self.ui.button_play_pause_icon)
 
-    def _update_xy_coords(self):
+    def _update_xy_coords(self, x, y):
         """
-        Shows current xy position of mouse
+        Shows current xy position of mouse (signal mouse_coords of plotcanvas, emitted at most once per frame)
+        :param x: x coordinate of mouse
+        :param y: y coordinate of mouse
         """
-        x = self.PlotCanvas_object.current_x
-        y = self.PlotCanvas_object.current_y
         xy = "x: {:3.2f} | y: {:3.2f}".format(x, y)
         self.ui.label_xy.setText(xy)
 
-    def _update_xy_coords_timer(self):
-        """
-        Updates current xy position of mouse every 25 ms as constant tracing would cost to much performance
-        """
-        timer = QTimer(self)
-        timer.timeout.connect(self._update_xy_coords)
-        timer.start(25)
-
     def _everything_is_chosen(self):
         """
         Often used button query
@@ -1017,6 +1307,9 @@ class GuiFunctionParser(QMainWindow):
         Kills current plotcanvas object to give birth o another.
         The circle of life
         """
+        # stop calculation of the plot to be removed
+        self._cancel_calculation()
+
         # remove plotcanvas object from gui
         self.ui.verticalLayout_plot_canvas.removeWidget(self.PlotCanvas_object)
         # delete, remove, destroy, crush, end, kill, shatter, smash, wreck, annul, butcher, erase, extinguish,
@@ -1030,6 +1323,8 @@ class GuiFunctionParser(QMainWindow):
         self.ui.verticalLayout_plot_canvas.addWidget(self.PlotCanvas_object)
         # set spinbox
         self.PlotCanvas_object.spinbox_currentposition = self.ui.spinbox_currentposition
+        # xy coords
+        self.PlotCanvas_object.mouse_coords.connect(self._update_xy_coords)
 
         # fix theme
         if self.normal_theme:
@@ -7,6 +7,11 @@ Helper functions that are used in gui module
 # <editor-fold desc="Open">
 
 # packages
+import collections
+import json
+import os
+import threading
+import numpy as np
 import matplotlib as mpl
 from matplotlib.backends.backend_agg import FigureCanvasAgg
 from PyQt5.QtGui import QImage, QPixmap
@@ -16,6 +21,24 @@ from PyQt5.QtWidgets import QLabel, QWidget
 ########### IMPORTS ###########
 
 
+# maximal number of rendered formulas kept in cache
+CACHE_SIZE = 512
+# file the cache is loaded from at start and saved to at exit (not persisted if not set)
+CACHE_FILE = os.environ.get("NOVIZ_LATEX_CACHE")
+
+CacheInfo = collections.namedtuple('CacheInfo', ('hits', 'misses', 'maxsize', 'currsize', 'hit_rate'))
+
+# LRU cache of rendered formulas: (mathTex, fontsize, normal_theme) -> (RGBA buffer, (width, height))
+_cache = collections.OrderedDict()
+_cache_stats = {"hits": 0, "misses": 0}
+# formulas may be rendered outside of the GUI thread (only QPixmaps are bound to it)
+_cache_lock = threading.Lock()
+# matplotlib's mathtext is not thread safe, so formulas are rendered one at a time
+_render_lock = threading.Lock()
+# background thread of prerender_mathtex (created on first use)
+_executor = None
+
+
 class MathTexPixmapWidget(QWidget):
     """
     Widget which is used to add QPixmaps to QTableWidget cells.
@@ -30,7 +53,8 @@ class MathTexPixmapWidget(QWidget):
 
 def mathtex_to_qpixmap(mathTex, fontsize=10, normal_theme=True):
     """
-    Function that converts Latex string to QPixmap
+    Function that converts Latex string to QPixmap.
+    Rendered formulas are cached (see mathtex_to_qimage)
     source: https://stackoverflow.com/questions/32035251/displaying-latex-in-pyqt-pyside-qtablewidget
 
     example with label:
@@ -46,6 +70,68 @@ def mathtex_to_qpixmap(mathTex, fontsize=10, normal_theme=True):
     :param normal_theme: determines font color
     :return: QPixmap of input string
     """
+    return QPixmap.fromImage(mathtex_to_qimage(mathTex, fontsize, normal_theme))
+
+
+def mathtex_to_qimage(mathTex, fontsize=10, normal_theme=True):
+    """
+    Converts Latex string to QImage. Unlike QPixmaps, QImages can be created outside of the GUI thread.
+    The last CACHE_SIZE rendered formulas are kept in a LRU cache, so each formula is only rendered once
+    :param mathTex: Latex input
+    :param fontsize: fontsize
+    :param normal_theme: determines font color
+    :return: QImage of input string
+    """
+    key = (mathTex, fontsize, normal_theme)
+    with _cache_lock:
+        rendered = _cache.get(key)
+        if rendered is not None:
+            _cache.move_to_end(key)
+            _cache_stats["hits"] += 1
+    if rendered is None:
+        with _render_lock:
+            # another thread might have rendered it in the meantime
+            with _cache_lock:
+                rendered = _cache.get(key)
+                if rendered is not None:
+                    _cache.move_to_end(key)
+                    _cache_stats["hits"] += 1
+            if rendered is None:
+                rendered = _render_mathtex(mathTex, fontsize, normal_theme)
+                with _cache_lock:
+                    _cache_stats["misses"] += 1
+                    _cache[key] = rendered
+                    while len(_cache) > CACHE_SIZE:
+                        _cache.popitem(last=False)
+    buf, size = rendered
+    return QImage.rgbSwapped(QImage(buf, size[0], size[1], QImage.Format_ARGB32))
+
+
+def prerender_mathtex(mathTexs, fontsize=10, normal_theme=True):
+    """
+    Renders Latex strings into the cache in a background thread, e.g. formulas that will be needed later on.
+    QImages can be converted to QPixmaps with QPixmap.fromImage in GUI thread
+    :param mathTexs: list of Latex inputs
+    :param fontsize: fontsize
+    :param normal_theme: determines font color
+    :return: Future of the list of QImages of the input strings
+    """
+    global _executor
+    if _executor is None:
+        # imported here as it is only needed for prerendering
+        from concurrent.futures import ThreadPoolExecutor
+        _executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="latex")
+    return _executor.submit(lambda: [mathtex_to_qimage(mathTex, fontsize, normal_theme) for mathTex in mathTexs])
+
+
+def _render_mathtex(mathTex, fontsize, normal_theme):
+    """
+    renders Latex string with matplotlib
+    :param mathTex: Latex input
+    :param fontsize: fontsize
+    :param normal_theme: determines font color
+    :return: RGBA buffer and its (width, height)
+    """
     # set up a mpl figure instance
     fig = mpl.figure.Figure()
     fig.patch.set_facecolor('none')
@@ -75,12 +161,67 @@ def mathtex_to_qpixmap(mathTex, fontsize=10, normal_theme=True):
     # tight_fheight+x <-- x altered to adjust for bigger tex formulas #2
     fig.set_size_inches(tight_fwidth, tight_fheight+0.1)
 
-    # convert mpl figure to QPixmap
+    # render mpl figure to buffer
     buf, size = fig.canvas.print_to_buffer()
-    qimage = QImage.rgbSwapped(QImage(buf, size[0], size[1], QImage.Format_ARGB32))
-    qpixmap = QPixmap(qimage)
+    return bytes(buf), size
+
+
+def cache_info():
+    """
+    :return: CacheInfo(hits, misses, maxsize, currsize, hit_rate) of formula cache
+    """
+    with _cache_lock:
+        calls = _cache_stats["hits"] + _cache_stats["misses"]
+        hit_rate = _cache_stats["hits"] / calls if calls else 0.0
+        return CacheInfo(_cache_stats["hits"], _cache_stats["misses"], CACHE_SIZE, len(_cache), hit_rate)
+
 
-    return qpixmap
+def clear_cache():
+    """
+    removes all formulas from cache and resets its stats
+    """
+    with _cache_lock:
+        _cache.clear()
+        _cache_stats["hits"] = 0
+        _cache_stats["misses"] = 0
+
+
+def save_cache(path=CACHE_FILE):
+    """
+    saves formula cache to disk (npz file with one RGBA image per formula)
+    :param path: file name (nothing is saved if None)
+    """
+    if path is None:
+        return
+    with _cache_lock:
+        entries = list(_cache.items())
+    images = {"image_{}".format(i): np.frombuffer(buf, dtype=np.uint8).reshape(size[1], size[0], 4)
+              for i, (key, (buf, size)) in enumerate(entries)}
+    directory = os.path.dirname(os.path.abspath(path))
+    os.makedirs(directory, exist_ok=True)
+    with open(path, "wb") as file:
+        np.savez_compressed(file, keys=np.array(json.dumps([key for key, rendered in entries])), **images)
+
+
+def load_cache(path=CACHE_FILE):
+    """
+    loads formulas saved with save_cache into cache
+    :param path: file name (nothing is loaded if None or not existing)
+    :return: number of loaded formulas
+    """
+    if path is None or not os.path.exists(path):
+        return 0
+    with np.load(path, allow_pickle=False) as data:
+        keys = json.loads(str(data["keys"]))
+        loaded = [((mathTex, fontsize, normal_theme), data["image_{}".format(i)])
+                  for i, (mathTex, fontsize, normal_theme) in enumerate(keys)]
+    with _cache_lock:
+        for key, image in loaded[-CACHE_SIZE:]:
+            _cache[key] = (image.tobytes(), (image.shape[1], image.shape[0]))
+            _cache.move_to_end(key)
+        while len(_cache) > CACHE_SIZE:
+            _cache.popitem(last=False)
+    return len(loaded)
 
 
 def detect_latex_in_string(text):
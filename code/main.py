@@ -42,14 +42,27 @@ class Main:
         :param startpoint: start point as x coordinate
         :return: algorithm with everything set and buffer array computed
         """
+        algorithm = self.create_algorithm(objective_function, objective_function_params, method, method_params)
+        algorithm.create_array(startpoint)
+
+        return algorithm
+
+    def create_algorithm(self, objective_function, objective_function_params, method, method_params, seed=None):
+        """
+        Sets up objective function and algorithm without computing the buffer array,
+        e.g. to compute it in a background thread (see gui.calculation)
+        :param objective_function: Objective function object
+        :param objective_function_params: objective function parameter as list
+        :param method: algorihm object
+        :param method_params: algorithm parameter as list
+        :param seed: seed of the random generator of the algorithm (None uses the global np.random state)
+        :return: algorithm with everything set
+        """
         # objective_functions
         function = objective_function(objective_function_params)
 
         # optimization
-        algorithm = method(function, method_params)
-        algorithm.create_array(startpoint)
-
-        return algorithm
+        return method(function, method_params, seed=seed)
 
 
 if __name__ == "__main__":
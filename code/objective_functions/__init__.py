@@ -11,6 +11,7 @@ objective_func_testing: test classes for objective functions
 
 
 from .objective_func import Polynomial, Sinus, Interpolated, LennardJonesPotential, TorsionPotential, BondAnglePotential, SimCrash
+from .objective_func import CachedObjectiveFunction, cached
 
 # dictionary of objective functions which is used in main and
 # which needs to extended if some new objective function is implemented
@@ -10,13 +10,12 @@ Set to be generic about newly added functions
 # <editor-fold desc="Open">
 
 # packages
-import pyclbr
 from abc import ABC, abstractmethod
+from collections import OrderedDict, namedtuple
 from operator import itemgetter
+import threading
 import numpy as np
 import re
-import matplotlib.pyplot as plt
-from scipy.interpolate import CubicSpline
 
 # files from objective functions
 from .coeff import Coeff, _round
@@ -26,6 +25,11 @@ from .coeff import Coeff, _round
 
 
 class ObjectiveFunction(ABC):
+    """
+    abstract base class for all objective functions.
+    Every objective function has to accept numpy arrays of any shape for x when called, i.e. f(x) and
+    f(x, True) are evaluated element wise without python loops. evaluate and gradient make this explicit
+    """
 
     @abstractmethod
     def __init__(self, coeff):
@@ -35,15 +39,44 @@ class ObjectiveFunction(ABC):
 
         self.coeff = coeff
 
-    def tangent_y(self, x, y, x_new):
+    def evaluate(self, xs):
+        """
+        evaluates the objective function at many x values at once
+        :param xs: x value or array like of x values of any shape
+        :return: numpy array of y values with the same shape as xs
+        """
+        xs = np.asarray(xs, dtype=float)
+        return _broadcast(self.__call__(xs), xs)
+
+    def gradient(self, xs):
+        """
+        evaluates the derivative of the objective function at many x values at once
+        :param xs: x value or array like of x values of any shape
+        :return: numpy array of slopes with the same shape as xs
+        """
+        xs = np.asarray(xs, dtype=float)
+        return _broadcast(self.__call__(xs, True), xs)
+
+    def value_and_grad(self, x):
+        """
+        evaluates function and derivative at once. Objective functions override this to compute
+        subexpressions that value and derivative have in common only once
+        :param x: x value or numpy array of x values
+        :return: tuple of y value and slope
+        """
+        return self.__call__(x), self.__call__(x, True)
+
+    def tangent_y(self, x, y, x_new, slope=None):
         """
         calculate position of arrow end
         :param x: x coordinate of arrow start point
         :param y: y coordinate of arrow start point
         :param x_new: x coordinate of arrow end point
+        :param slope: slope at x if already known (computed otherwise)
         :return: y coordinate of arrow end point
         """
-        slope = self.__call__(x, True)
+        if slope is None:
+            slope = self.__call__(x, True)
         intercept = y - slope * x
         return slope * x_new + intercept
 
@@ -133,27 +166,36 @@ class Polynomial(ObjectiveFunction):
         :param coeff: is a list of coefficients
         """
         super(Polynomial, self).__init__(coeff)
-        self.coeff = coeff
+
+    @property
+    def coeff(self):
+        """
+        :return: list of coefficients, lowest order first
+        """
+        return self._coeff
+
+    @coeff.setter
+    def coeff(self, coeff):
+        """
+        sets the coefficients and prepares them for horner's method (highest order first, as in np.polyval)
+        :param coeff: is a list of coefficients, lowest order first
+        """
+        self._coeff = coeff
+        self.horner = tuple(float(c) for c in reversed(coeff))
+        self.horner_derivative = tuple(float(c) for c in np.polyder(self.horner)) if len(coeff) > 1 else (0.0,)
 
     # makes a more intuitive programming possible with f(x)
     def __call__(self, x, derivative=False):
         """
         makes it possible to call a function at a more mathematical
         approach e.g. f(x)
-        :param x: is a list of coefficients
+        :param x: x value or numpy array of x values
         :param derivative: bool which determines if the derivative of a function should be used (default False)
         """
         if derivative:
-            res = 0
-            for index, c in enumerate(self.coeff):
-                res += index * c * x ** (index - 1)
-            return res
+            return _horner(self.horner_derivative, x)
         else:
-            res = 0
-            for index, c in enumerate(self.coeff):
-                # print("here", x, res)
-                res += c * x ** index
-            return res
+            return _horner(self.horner, x)
 
     def __str__(self):
         """
@@ -249,6 +291,15 @@ class Sinus(ObjectiveFunction):
             return np.sin(x * self.coeff[3] + self.coeff[2]) * self.coeff[1] + \
                    self.coeff[0]
 
+    def value_and_grad(self, x):
+        """
+        evaluates function and derivative at once (argument of sine and cosine computed once)
+        :param x: x value or numpy array of x values
+        :return: tuple of y value and slope
+        """
+        argument = x * self.coeff[3] + self.coeff[2]
+        return np.sin(argument) * self.coeff[1] + self.coeff[0], np.cos(argument) * self.coeff[1] * self.coeff[3]
+
     def __str__(self):
         """
         print representation of sinus objective function
@@ -327,32 +378,46 @@ class Interpolated(ObjectiveFunction):
 
     def __init__(self, coeff):
         """
-        initializer for a sinus function
-        :param coeff: list of user input points
+        initializer for a interpolated function
+        :param coeff: list of user input points (at least two, raises ValueError otherwise)
         """
         super(Interpolated, self).__init__(coeff)
 
-        self.coeff = coeff
+    @property
+    def coeff(self):
+        """
+        :return: user input points sorted by x as tuple of (x, y) tuples. It is immutable as the spline is
+            only rebuilt when new points are set
+        """
+        return self._coeff
+
+    @coeff.setter
+    def coeff(self, coeff):
+        """
+        sets the points to interpolate through and builds the spline and its derivative once,
+        so that calls do not need to build them again
+        :param coeff: list of user input points (at least two, raises ValueError otherwise)
+        """
+        # scipy is imported here as importing it takes much longer than everything else in this module
+        from scipy.interpolate import CubicSpline
+        if len(coeff) < 2:
+            raise ValueError("at least two points are needed to interpolate, got {}".format(len(coeff)))
+        self._coeff = tuple(sorted((tuple(point) for point in coeff), key=itemgetter(0)))
+        points = np.array(self._coeff, dtype=float).reshape(-1, 2)
+        self.spline = CubicSpline(points[:, 0], points[:, 1])
+        self.spline_derivative = self.spline.derivative()
 
     def __call__(self, x, derivative=False):
         """
         makes it possible to call a function at a more mathematical
         approach e.g. f(x)
-        :param x: is a list of coefficients
+        :param x: x value or numpy array of x values
         :param derivative: bool which determines if the derivative of a function should be used (default False)
         """
-        x_points = []
-        y_points = []
-        self.coeff.sort(key=itemgetter(0))
-        for val in enumerate(self.coeff):
-            x_points = np.append(x_points, val[1][0])
-            y_points = np.append(y_points, val[1][1])
         if derivative:
-            f = CubicSpline(x_points, y_points).derivative()
-            return f(x)
+            return self.spline_derivative(x)
         else:
-            f = CubicSpline(x_points, y_points)
-            return f(x)
+            return self.spline(x)
 
     def __str__(self):
         """
@@ -412,11 +477,22 @@ class SimCrash(ObjectiveFunction):
         """
         if derivative:
             # return -(np.exp(12.5*(x-1)**2) - 0.5 * (np.exp(-(x+1)**2/18)))
-            return np.exp(-1/18 * (x + 1)**2)*(0.0555556*x + 0.0555556) + 100. * np.exp(-50. *(x - 1)**2)*(x - 1)
+            return np.exp((-(x + 1) ** 2) / (2 * 3 ** 2))*(0.0555556*x + 0.0555556) + \
+                100. * np.exp((-(x - 1) ** 2) / (2 * 0.1 ** 2))*(x - 1)
             # return ((x + 1) * (np.exp((-(x + 1) ** 2))) / 18) / 18 + 100 * (x - 1) * np.exp(-50 * (x - 1) ** 2)
         else:
             return -np.exp((-(x - 1) ** 2) / (2 * 0.1 ** 2)) - 0.5 * np.exp((-(x + 1) ** 2) / (2 * 3 ** 2))
 
+    def value_and_grad(self, x):
+        """
+        evaluates function and derivative at once (both exponential terms computed once)
+        :param x: x value or numpy array of x values
+        :return: tuple of y value and slope
+        """
+        narrow = np.exp((-(x - 1) ** 2) / (2 * 0.1 ** 2))
+        wide = np.exp((-(x + 1) ** 2) / (2 * 3 ** 2))
+        return -narrow - 0.5 * wide, wide*(0.0555556*x + 0.0555556) + 100. * narrow*(x - 1)
+
     def create_formula_string(self, coeffs):
         """
         :param coeffs: not needed in sim crash objective function
@@ -466,12 +542,24 @@ class LennardJonesPotential(ObjectiveFunction):
         :param x: is a list of coefficients (not needed here)
         :param derivative: bool which determines if the derivative of a function should be used (default False)
         """
+        x_6 = x ** 6
         if derivative:
             return 24 * self.coeff[0] * self.coeff[1] ** 6 * \
-                   (x ** 6 - 2 * self.coeff[1] ** 6) / x ** 13
+                   (x_6 - 2 * self.coeff[1] ** 6) / (x_6 * x_6 * x)
         else:
-            return 4 * self.coeff[0] * ((self.coeff[1] ** 12 / (x ** 12)) - (
-                        self.coeff[1] ** 6 / (x ** 6)))
+            return 4 * self.coeff[0] * ((self.coeff[1] ** 12 / (x_6 * x_6)) - (
+                        self.coeff[1] ** 6 / x_6))
+
+    def value_and_grad(self, x):
+        """
+        evaluates function and derivative at once (x ** 12 and x ** 13 derived from x ** 6)
+        :param x: x value or numpy array of x values
+        :return: tuple of y value and slope
+        """
+        x_6 = x ** 6
+        x_12 = x_6 * x_6
+        return 4 * self.coeff[0] * ((self.coeff[1] ** 12 / x_12) - (self.coeff[1] ** 6 / x_6)), \
+            24 * self.coeff[0] * self.coeff[1] ** 6 * (x_6 - 2 * self.coeff[1] ** 6) / (x_12 * x)
 
     def __str__(self):
         """
@@ -541,6 +629,15 @@ class TorsionPotential(ObjectiveFunction):
         else:
             return self.coeff[1] / 2 * (np.cos(x) - np.cos(self.coeff[0])) ** 2
 
+    def value_and_grad(self, x):
+        """
+        evaluates function and derivative at once (cosine term computed once)
+        :param x: x value or numpy array of x values
+        :return: tuple of y value and slope
+        """
+        cosine = np.cos(x) - np.cos(self.coeff[0])
+        return self.coeff[1] / 2 * cosine ** 2, -self.coeff[1] * cosine * np.sin(x)
+
     def __str__(self):
         """
         :returns: torsian angle potential objective function print representation
@@ -608,6 +705,15 @@ class BondAnglePotential(ObjectiveFunction):
         else:
             return self.coeff[1] / 2 * (x - self.coeff[0]) ** 2
 
+    def value_and_grad(self, x):
+        """
+        evaluates function and derivative at once (distance to equilibrium angle computed once)
+        :param x: x value or numpy array of x values
+        :return: tuple of y value and slope
+        """
+        distance = x - self.coeff[0]
+        return self.coeff[1] / 2 * distance ** 2, self.coeff[1] * distance
+
     def __str__(self):
         """
         :returns: bond angle potential objective function print representation
@@ -647,6 +753,224 @@ class BondAnglePotential(ObjectiveFunction):
             y_min, y_max = y_max, y_min
         return y_min, y_max, x_min, x_max
 
+
+CacheInfo = namedtuple('CacheInfo', ('hits', 'misses', 'maxsize', 'currsize', 'hit_rate'))
+
+
+class CachedObjectiveFunction:
+    """
+    Transparent wrapper of an objective function that memoizes scalar calls f(x), f(x, True) and
+    value_and_grad(x) in a bounded cache (least recently used values are evicted).
+    Array calls (evaluate, gradient, f(array)) are passed on uncached. All other attributes (coefficients,
+    axes parameters, str, ...) are read from and written to the wrapped function.
+    The cache is cleared when attributes are set through the wrapper and when the coefficients of the wrapped
+    function are replaced (coefficients changed in place, e.g. coeff[0] = 2, are not noticed).
+    Meant for code that evaluates the same x values repeatedly, e.g. the plot canvas (see
+    PlotCanvas._objective_function) or costly user supplied functions. Algorithms hardly ever evaluate an x value
+    twice, so they use their objective function unwrapped.
+
+    example:
+        function = CachedObjectiveFunction(Sinus([1, 1, 1, 1]))
+        function(2.0), function(2.0)
+        function.cache_info()  # CacheInfo(hits=1, misses=1, ...)
+    """
+    # attributes of the wrapper itself, all others belong to the wrapped function
+    _own_attributes = ('function', 'maxsize', 'hits', 'misses', '_cache', '_coeff', '_lock')
+
+    def __init__(self, function, maxsize=1024):
+        """
+        init
+        :param function: objective function object
+        :param maxsize: maximal number of cached values
+        """
+        self.function = function
+        self.maxsize = maxsize
+        self._cache = OrderedDict()
+        # coefficients the cached values belong to
+        self._coeff = getattr(function, 'coeff', None)
+        # the cache may be shared by several threads
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def __call__(self, x, derivative=False):
+        """
+        :param x: x value (scalars are cached) or numpy array of x values
+        :param derivative: bool which determines if the derivative of a function should be used (default False)
+        :return: y value respectively slope
+        """
+        if np.ndim(x) != 0:
+            return self.function(x, derivative)
+        key = (float(x), bool(derivative))
+        value = self._lookup(key)
+        if value is None:
+            value = self.function(x, derivative)
+            self._store(key, value)
+        return value
+
+    def value_and_grad(self, x):
+        """
+        :param x: x value (scalars are cached) or numpy array of x values
+        :return: tuple of y value and slope (both cached)
+        """
+        if np.ndim(x) != 0:
+            return self.function.value_and_grad(x)
+        value_key, slope_key = (float(x), False), (float(x), True)
+        value, slope = self._lookup(value_key), self._lookup(slope_key)
+        if value is None and slope is None:
+            value, slope = self.function.value_and_grad(x)
+            self._store(value_key, value)
+            self._store(slope_key, slope)
+        elif value is None:
+            value = self.function(x)
+            self._store(value_key, value)
+        elif slope is None:
+            slope = self.function(x, True)
+            self._store(slope_key, slope)
+        return value, slope
+
+    def _lookup(self, key):
+        """
+        :param key: tuple of x value and derivative flag
+        :return: cached value or None if not cached (counted as hit respectively miss)
+        """
+        with self._lock:
+            coeff = getattr(self.function, 'coeff', None)
+            if coeff is not self._coeff:
+                self._cache.clear()
+                self._coeff = coeff
+            value = self._cache.get(key)
+            if value is None:
+                self.misses += 1
+                return None
+            self._cache.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def _store(self, key, value):
+        """
+        adds value to cache, least recently used values are evicted if it is full
+        :param key: tuple of x value and derivative flag
+        :param value: function value respectively slope
+        """
+        with self._lock:
+            self._cache[key] = value
+            while len(self._cache) > self.maxsize:
+                self._cache.popitem(last=False)
+
+    def __getattr__(self, name):
+        """
+        delegates reading attributes to the wrapped function
+        :param name: attribute name
+        :return: attribute of wrapped function
+        """
+        # not delegated: special methods (e.g. looked up while unpickling) and own attributes before they are set
+        if name.startswith('__') or name in self._own_attributes:
+            raise AttributeError(name)
+        return getattr(self.function, name)
+
+    def __setattr__(self, name, value):
+        """
+        delegates setting attributes to the wrapped function (cached values are cleared)
+        :param name: attribute name
+        :param value: new value
+        """
+        if name in self._own_attributes:
+            object.__setattr__(self, name, value)
+        else:
+            setattr(self.function, name, value)
+            self.clear_cache()
+
+    def __getstate__(self):
+        """
+        :return: state for pickling (e.g. to send it to worker processes), with empty cache and counters
+        """
+        state = self.__dict__.copy()
+        del state['_lock']
+        state.update(_cache=OrderedDict(), hits=0, misses=0)
+        return state
+
+    def __setstate__(self, state):
+        """
+        :param state: state from __getstate__
+        """
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
+
+    def __str__(self):
+        """
+        print representation of wrapped objective function
+        """
+        return str(self.function)
+
+    def tangent_y(self, x, y, x_new, slope=None):
+        """
+        calculate position of arrow end (with cached slope)
+        :param x: x coordinate of arrow start point
+        :param y: y coordinate of arrow start point
+        :param x_new: x coordinate of arrow end point
+        :param slope: slope at x if already known (taken from cache or computed otherwise)
+        :return: y coordinate of arrow end point
+        """
+        if slope is None:
+            slope = self(x, True)
+        intercept = y - slope * x
+        return slope * x_new + intercept
+
+    def cache_info(self):
+        """
+        :return: CacheInfo with hits, misses, maximal and current size and hit rate of cache
+        """
+        with self._lock:
+            calls = self.hits + self.misses
+            return CacheInfo(self.hits, self.misses, self.maxsize, len(self._cache),
+                             self.hits / calls if calls else 0.0)
+
+    def clear_cache(self):
+        """
+        removes all cached values and resets hit and miss counters
+        """
+        with self._lock:
+            self._cache.clear()
+            self.hits = self.misses = 0
+
+
+def cached(function, maxsize=1024):
+    """
+    :param function: objective function object
+    :param maxsize: maximal number of cached values
+    :return: function wrapped in a CachedObjectiveFunction (function itself if it is wrapped already)
+    """
+    if isinstance(function, CachedObjectiveFunction):
+        return function
+    return CachedObjectiveFunction(function, maxsize)
+
+
+def _horner(coefficients, x):
+    """
+    evaluates a polynomial with horner's method like np.polyval, but without its array conversions
+    which cost more than the evaluation itself for scalar x
+    :param coefficients: tuple of coefficients, highest order first
+    :param x: x value or numpy array of x values
+    :return: polynomial value(s) at x
+    """
+    y = 0.0
+    for c in coefficients:
+        y = y * x + c
+    return y
+
+
+def _broadcast(ys, xs):
+    """
+    :param ys: result of an objective function call
+    :param xs: numpy array of x values the objective function has been called with
+    :return: ys as float numpy array with the shape of xs (functions that are constant in x return a scalar)
+    """
+    ys = np.asarray(ys, dtype=float)
+    if ys.shape != xs.shape:
+        ys = np.broadcast_to(ys, xs.shape).copy()
+    return ys
+
 # TODO: Under construction
 #class Torda(ObjectiveFunction):
 #
@@ -717,6 +1041,8 @@ class BondAnglePotential(ObjectiveFunction):
 
 
 if __name__ == "__main__":
+    # only needed for this demo, importing it on module level would pull in matplotlib for every user
+    import matplotlib.pyplot as plt
     p = SimCrash(0)
     x = np.linspace(-10, 5, 100, endpoint=True)
     plt.axis([-10, 5, -2, 1.5])
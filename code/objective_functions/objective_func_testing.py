@@ -32,7 +32,7 @@ class TestObjectiveFunctions(unittest.TestCase):
         self.assertEqual(p(-3), 9)
         
         p = Polynomial([35,5,7])
-        self.assertEqual(p(8.35), 564.8075)
+        self.assertAlmostEqual(p(8.35), 564.8075)
         self.assertEqual(p(4.32), 187.23680000000002)
         self.assertEqual(p(-1.004), 37.036112)
         
@@ -7,6 +7,8 @@ params: class for storing method parameter
 algorithms: class for storing and adding new algorithms
 bufferArray: array class for storing all precalculated information about all plot object such as points, vectors,
              and the like
+laneArray: array class for storing the trajectories of many runs that are advanced in lockstep
+runStore: saving and (memory mapped) loading of computed buffer arrays as run files
 """
 
 
@@ -9,10 +9,12 @@ Set to be generic about newly added algoithms
 
 # packages
 from abc import ABC, abstractmethod
+import collections
 import numpy as np
 
 # files from optimization
-from optimization.bufferArray import BufferArray
+from .bufferArray import BufferArray, Frame
+from .laneArray import LaneArray
 from .params import Param
 
 # </editor-fold>
@@ -28,32 +30,85 @@ def nextstep(y_old, y_new):
     return (abs(y_old - y_new) > 0)
 
 
+Chains = collections.namedtuple('Chains', ('array', 'chain_offsets', 'best_points', 'best_point'))
+
+
+def _run_chain(ObjectiveFunction, params, startpoint, seed):
+    """
+    runs one simulated annealing chain. Needs to be a module level function to be sent to worker processes
+    :param ObjectiveFunction: objective function object (has to be picklable)
+    :param params: simulated annealing parameters
+    :param startpoint: start point of the chain
+    :param seed: seed of the chain, e.g. a np.random.SeedSequence
+    :return: buffer array of the chain
+    """
+    algorithm = SimulatedAnnealing(ObjectiveFunction, params, seed=seed)
+    algorithm.create_array(startpoint)
+    return algorithm.array
+
+
 class Algorithm(ABC):
     """
     abstract base class that implements all functions and abstract functions that are
     necessary to add new algorithms
     """
     @abstractmethod
-    def __init__(self, ObjectiveFunction):
+    def __init__(self, ObjectiveFunction, seed=None):
         """
         init
         :param ObjectiveFunction: objective function on which the algorithm runs
+        :param seed: seed for an own random generator (int or np.random.SeedSequence).
+            If None the global np.random state is used
         """
         self.ObjectiveFunction = ObjectiveFunction
+        self.random = np.random if seed is None else np.random.default_rng(seed)
         self.scatter = False
         self.scatter_colormapname = None
         self.scatter_min = None
         self.scatter_max = None
+        # share of create_array done (0 to 1) and cancel request, e.g. when create_array runs in a thread
+        self.progress = 0.0
+        self.cancelled = False
+        # True if create_array stopped because the buffer array reached its maximal capacity
+        self.truncated = False
 
     @abstractmethod
-    def create_array(self, startpoint):
+    def iter_frames(self, startpoint):
         """
-        abstract method that creates the full buffer array according to algorithm specific
-        function and parameters
+        abstract generator that yields the frames of the algorithm one by one (lazily) according to
+        algorithm specific function and parameters
         :param startpoint: start point of calculation
+        :returns: generator of Frame objects (arguments of BufferArray.push)
         """
         pass
 
+    def create_array(self, startpoint):
+        """
+        creates the full buffer array by collecting all frames of iter_frames.
+        Stops when the maximal capacity of the buffer array is reached (sets truncated), frames computed so far
+        are kept
+        :param startpoint: start point of calculation
+        """
+        self.progress = 0.0
+        self.truncated = False
+        self.array = BufferArray(max_capacity=self.buffer_array_length)
+        for frame in self.iter_frames(startpoint):
+            if self.array.full():
+                self.truncated = True
+                self.progress = 1.0
+                break
+            self.array.push_frame(frame)
+
+        # release capacity that was not needed
+        self.array.trim()
+
+    def cancel(self):
+        """
+        requests create_array to stop after the current step. Frames computed so far are kept.
+        The request stays set (also for later calls of create_array) until cancelled is reset by the caller
+        """
+        self.cancelled = True
+
     def get_params_defaults(self):
         """
         creates list of param objects containing default values
@@ -88,8 +143,17 @@ class GradientDescent(Algorithm):
     """
     Gradient descent algorithm class (inheriting from which)
     """
+    # static per class, so it can be shown (and rendered) without an instance
+    pseudocode = ['set iter$_{max}$, step = 0',
+                  'x = set starting point',
+                  'y = f(x)',
+                  'while $(step < iter_{max}$)',
+                  '$\quad x_{new} = x - step size \cdot  \delta f(x)$',
+                  '$\quad$ x = $x_{new}$',
+                  '$\quad$ y = f($x_{new}$)',
+                  '$\quad step += 1$']
 
-    def __init__(self, ObjectiveFunction, params):
+    def __init__(self, ObjectiveFunction, params, seed=None):
         """
         init a bufferArray
         :param ObjectiveFunction: chosen objective function
@@ -97,51 +161,80 @@ class GradientDescent(Algorithm):
             those parameters are:
                 - learning rate
                 - max step
+        :param seed: seed for an own random generator (not used by gradient descent, see Algorithm)
         """
-        super(GradientDescent, self).__init__(ObjectiveFunction)
-        self.ObjectiveFunction = ObjectiveFunction
+        super(GradientDescent, self).__init__(ObjectiveFunction, seed)
         self.learningrate = params[0]
         self.max_steps = params[1]
-        self.pseudocode = ['set iter$_{max}$, step = 0',
-                           'x = set starting point',
-                           'y = f(x)',
-                           'while $(step < iter_{max}$)',
-                           '$\quad x_{new} = x - step size \cdot  \delta f(x)$',
-                           '$\quad$ x = $x_{new}$',
-                           '$\quad$ y = f($x_{new}$)',
-                           '$\quad step += 1$']
         self.buffer_array_length = int(self.max_steps * len(self.pseudocode))
 
-    def create_array(self, startpoint):
+    def iter_frames(self, startpoint):
         """
-        create bufferArray of the results of the gradient descent algorithm
-        :param startpoint: tuple of x, y coordinates of start point
+        yields the frames of the gradient descent algorithm
+        :param startpoint: x coordinate of start point
+        :returns: generator of Frame objects
         """
-        self.array = BufferArray(self.buffer_array_length)
         next_step = True
         steps = 0
         x = startpoint
-        y = self.ObjectiveFunction(x)
+        # value and slope are computed together (see ObjectiveFunction.value_and_grad)
+        y, gradient = self.ObjectiveFunction.value_and_grad(x)
         x_lower_bound = -10000
         x_upper_bound = 10000
 
-        # array.pushs in between are there to set current pseudo code line
-        self.array.push(2, [[x, y]], None, None)
-        while next_step and (steps < self.max_steps) and (x_lower_bound < x < x_upper_bound):
-            self.array.push(3, [[x, y]], None, None)
-            gradient = self.ObjectiveFunction(x, True)
+        # frames in between are there to set current pseudo code line
+        yield Frame(2, [[x, y]], None, None)
+        while next_step and (steps < self.max_steps) and (x_lower_bound < x < x_upper_bound) and \
+                not self.cancelled:
+            yield Frame(3, [[x, y]], None, None)
             stepsize = -self.learningrate * gradient
-            self.array.push(4, [[x, y]], None,
-                            [[x, y, x - 1, y - gradient], [x, y, x + 1, y + gradient]])
+            yield Frame(4, [[x, y]], None,
+                        [[x, y, x - 1, y - gradient], [x, y, x + 1, y + gradient]])
             x_new = x + stepsize
-            y_new = self.ObjectiveFunction(x_new)
-            vector_y = self.ObjectiveFunction.tangent_y(x,y, x_new)
-            self.array.push(6, [[x_new, y_new]], [[x, y, x_new-x, vector_y-y]],
-                            [[x, y, x - 1, y - gradient], [x, y, x + 1, y + gradient]])
+            y_new, gradient_new = self.ObjectiveFunction.value_and_grad(x_new)
+            vector_y = self.ObjectiveFunction.tangent_y(x, y, x_new, gradient)
+            yield Frame(6, [[x_new, y_new]], [[x, y, x_new-x, vector_y-y]],
+                        [[x, y, x - 1, y - gradient], [x, y, x + 1, y + gradient]])
             steps += 1
+            self.progress = steps / self.max_steps
             next_step = nextstep(y, y_new)
 
-            x, y = x_new, y_new
+            x, y, gradient = x_new, y_new, gradient_new
+
+        if not self.cancelled:
+            self.progress = 1.0
+
+    def create_lanes(self, startpoints):
+        """
+        runs gradient descent from many start points at once (e.g. a np.linspace over the x range of
+        get_axes_parameters). All lanes are advanced in lockstep, so every step costs one vectorized gradient
+        and one vectorized function evaluation. Each lane stops on its own with the same criteria as create_array
+        :param startpoints: array like of x coordinates of start points
+        :returns: LaneArray with the trajectories of all lanes (also stored as self.lanes)
+        """
+        x = np.array(startpoints, dtype=float).ravel()
+        y = self.ObjectiveFunction.evaluate(x)
+        self.lanes = LaneArray(x, y, max_capacity=int(self.max_steps) + 1)
+        x_lower_bound = -10000
+        x_upper_bound = 10000
+
+        active = (x_lower_bound < x) & (x < x_upper_bound)
+        steps = 0
+        while active.any() and (steps < self.max_steps):
+            lanes = np.flatnonzero(active)
+            x_old, y_old = x[lanes], y[lanes]
+            x_new = x_old - self.learningrate * self.ObjectiveFunction.gradient(x_old)
+            y_new = self.ObjectiveFunction.evaluate(x_new)
+            x[lanes], y[lanes] = x_new, y_new
+            self.lanes.push(x, y)
+            self.lanes.steps[lanes] += 1
+            next_step = nextstep(y_old, y_new)
+            self.lanes.converged[lanes] = ~next_step & np.isfinite(y_new)
+            active[lanes] = next_step & (x_lower_bound < x_new) & (x_new < x_upper_bound)
+            steps += 1
+
+        self.lanes.trim()
+        return self.lanes
 
     def get_params(self):
         """
@@ -157,8 +250,22 @@ class SimulatedAnnealing(Algorithm):
     """
     Simulated Annealing algorithm class (inheriting from which)
     """
+    # static per class, so it can be shown (and rendered) without an instance
+    pseudocode = ['init: Temp.: $T$ and starting point: $x$',
+                  'y = f(x)',
+                  'step = 0',
+                  'while ($T$ > 0) & $(step < iter_{max}$)',
+                  '$\quad$ choose new point ($x_{new}$)',
+                  '$\quad$ $y_{new}$ = $f(x_{new})$',
+                  '$\quad$ if ($y_{new}$ < $y$)',
+                  '$\quad\quad$ x = $x_{new}$, y = $y_{new}$',
+                  '$\quad\quad$ set new starting point at (x, y)',
+                  '$\quad$ else',
+                  '$\quad\quad$ accept with prob. exp(-$\delta$/T)',
+                  '$\quad T_{new} = T \cdot T$ decrease rate',
+                  '$\quad$step += 1']
 
-    def __init__(self, ObjectiveFunction, params):
+    def __init__(self, ObjectiveFunction, params, seed=None):
         """
         init a bufferArray
 
@@ -169,67 +276,84 @@ class SimulatedAnnealing(Algorithm):
             - standard deviation
             - start temperature
             - temperature decrease rate
+        :param seed: seed for an own random generator (int or np.random.SeedSequence).
+            If None the global np.random state is used
         """
-        super(SimulatedAnnealing, self).__init__(ObjectiveFunction)
-        self.ObjectiveFunction = ObjectiveFunction
+        super(SimulatedAnnealing, self).__init__(ObjectiveFunction, seed)
         self.max_steps = params[0]
         self.standard_deviation = params[1]
         self.start_temperatur = params[2]
         self.temperatur_decreaserate = params[3]
-        self.pseudocode = ['init: Temp.: $T$ and starting point: $x$',
-                           'y = f(x)',
-                           'step = 0',
-                           'while ($T$ > 0) & $(step < iter_{max}$)',
-                           '$\quad$ choose new point ($x_{new}$)',
-                           '$\quad$ $y_{new}$ = $f(x_{new})$',
-                           '$\quad$ if ($y_{new}$ < $y$)',
-                           '$\quad\quad$ x = $x_{new}$, y = $y_{new}$',
-                           '$\quad\quad$ set new starting point at (x, y)',
-                           '$\quad$ else',
-                           '$\quad\quad$ accept with prob. exp(-$\delta$/T)',
-                           '$\quad T_{new} = T \cdot T$ decrease rate',
-                           '$\quad$step += 1']
         self.scatter = True
         self.scatter_colormapname = 'plasma'
         self.scatter_min = 0
         self.scatter_max = self.start_temperatur
         self.buffer_array_length = int(self.max_steps * len(self.pseudocode))
 
-    def create_array(self, startpoint):
+    def iter_frames(self, startpoint):
         """
-        create bufferArray of the results of the simulated annealing algorithm
-        :param startpoint: tuple of x, y coordinates of start point
+        yields the frames of the simulated annealing algorithm
+        :param startpoint: x coordinate of start point
+        :returns: generator of Frame objects
         """
-        self.array = BufferArray(self.buffer_array_length)
         temperatur = self.start_temperatur
         step = 0
         x = startpoint
         y = self.ObjectiveFunction(x)
-        self.array.push(0, [(x, y)], None, None, scatter=[(x, y, temperatur)])
-        while (temperatur > 0) & (step < self.max_steps):  # temperatur > 0 -> macht das sinn?
-            self.array.push(3, [(x, y)], None, None)
-            random = np.random.normal(scale=self.standard_deviation)
+        yield Frame(0, [(x, y)], None, None, scatter=[(x, y, temperatur)])
+        while (temperatur > 0) & (step < self.max_steps) and not self.cancelled:  # temperatur > 0 -> macht das sinn?
+            yield Frame(3, [(x, y)], None, None)
+            random = self.random.normal(scale=self.standard_deviation)
             x_new = x + random
             y_new = self.ObjectiveFunction(x_new)
-            self.array.push(5, [(x, y)], None, None, nextpoint=[[(x_new, y_new)], 'black'])
-            self.array.push(6, [(x, y)], None, None, nextpoint=[[(x_new, y_new)], 'black'])
+            yield Frame(5, [(x, y)], None, None, nextpoint=[[(x_new, y_new)], 'black'])
+            yield Frame(6, [(x, y)], None, None, nextpoint=[[(x_new, y_new)], 'black'])
             if y_new < y:
                 x = x_new
                 y = y_new
-                self.array.push(8, [(x, y)], None, None, nextpoint=[[(x_new, y_new)], 'green'])
+                yield Frame(8, [(x, y)], None, None, nextpoint=[[(x_new, y_new)], 'green'])
             else: 
-                self.array.push(9, [(x, y)], None, None, nextpoint=[[(x_new, y_new)], 'black'])
+                yield Frame(9, [(x, y)], None, None, nextpoint=[[(x_new, y_new)], 'black'])
                 p = np.exp(-(y_new - y) / temperatur)
-                rand = np.random.random()
+                rand = self.random.random()
                 if rand < p:
                     x = x_new
                     y = y_new
-                    self.array.push(10, [(x, y)], None, None, nextpoint=[[(x_new, y_new)], 'green'])
+                    yield Frame(10, [(x, y)], None, None, nextpoint=[[(x_new, y_new)], 'green'])
                 else:
-                    self.array.push(10, [(x, y)], None, None, nextpoint=[[(x_new, y_new)], 'red'])
-            self.array.push(12, [(x, y)], None, None, scatter=[(x, y, temperatur)])
+                    yield Frame(10, [(x, y)], None, None, nextpoint=[[(x_new, y_new)], 'red'])
+            yield Frame(12, [(x, y)], None, None, scatter=[(x, y, temperatur)])
             temperatur = temperatur * self.temperatur_decreaserate
             step += 1
+            self.progress = step / self.max_steps
+
+        if not self.cancelled:
+            self.progress = 1.0
+
+    def create_chains(self, startpoint, chains, seed=None, max_workers=None):
+        """
+        runs independent simulated annealing chains in parallel worker processes and merges their
+        buffer arrays (in chain order) into self.array. Every chain gets its own random generator spawned
+        from one np.random.SeedSequence, so results are reproducible for a given seed
+        :param startpoint: start point of all chains or list of one start point per chain
+        :param chains: number of chains
+        :param seed: seed of the seed sequence (None for fresh entropy)
+        :param max_workers: number of worker processes (None means number of cpus)
+        :return: Chains(array, chain_offsets, best_points, best_point) with the merged buffer array, the frame
+            index each chain starts at, the lowest point of each chain and the lowest point of all chains
+        """
+        # imported here as it pulls in multiprocessing which is not needed otherwise
+        from concurrent.futures import ProcessPoolExecutor
+        startpoints = np.broadcast_to(np.asarray(startpoint, dtype=float), (chains,)).tolist()
+        seeds = np.random.SeedSequence(seed).spawn(chains)
+        params = [self.max_steps, self.standard_deviation, self.start_temperatur, self.temperatur_decreaserate]
+        with ProcessPoolExecutor(max_workers) as executor:
+            arrays = list(executor.map(_run_chain, [self.ObjectiveFunction] * chains, [params] * chains,
+                                       startpoints, seeds))
+        self.array = BufferArray.merge(arrays)
+        chain_offsets = np.cumsum([0] + [len(array) for array in arrays[:-1]])
+        best_points = [array.get_minimum() for array in arrays]
+        return Chains(self.array, chain_offsets, best_points, self.array.get_minimum())
 
     def get_params(self):
         """
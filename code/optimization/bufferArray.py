@@ -3,6 +3,10 @@ Buffer Array class.
 Contains all plot relevant entities and is stored when objective function, algorithm and depending parameters as well
 as a start point are set and button 'calculate' is pressed.
 See "Arrayentry" for more information
+
+The entities are stored column wise in typed numpy arrays (one row per frame) rather than as one python object per
+frame. Vectors and lines may vary in number from frame to frame and are therefore stored as ragged arrays: one flat
+data array plus an offset array, where the vectors of frame i are vector_data[vector_offsets[i]:vector_offsets[i+1]].
 """
 
 
@@ -11,6 +15,7 @@ See "Arrayentry" for more information
 
 # packages
 import collections
+import numpy as np
 
 #</editor-fold>
 ########### IMPORTS ###########
@@ -21,27 +26,160 @@ Arrayentry = collections.namedtuple('Arrayentry',
                                      'points',
                                      'vectors',
                                      'lines',
+                                     'scatterpoints_start',
                                      'scatterpoints_position',
                                      'nextpoint',
                                      'lowest_point'))
 
+# one frame as yielded by the frame generators of the algorithms (arguments of BufferArray.push)
+Frame = collections.namedtuple('Frame',
+                               ('pseudocodeline',
+                                'points',
+                                'vectors',
+                                'lines',
+                                'scatter',
+                                'nextpoint'),
+                               defaults=(None, None))
+
 
-class BufferArray:    
+class ArrayentryView:
+    """
+    Lightweight view on one frame of a buffer array. Offers the same fields as "Arrayentry" but reads them
+    from the columns of the buffer array on access instead of storing them.
+    Points, vectors and lines are returned as numpy views of shape (n, 2) respectively (n, 4) or None if empty.
+    """
+    __slots__ = ('buffer_array', 'index')
+
+    def __init__(self, buffer_array, index):
+        """
+        init
+        :param buffer_array: buffer array the frame belongs to
+        :param index: frame index in buffer array
+        """
+        self.buffer_array = buffer_array
+        self.index = index
+
+    def __repr__(self):
+        """
+        :returns: string representation in the form of an "Arrayentry"
+        """
+        return repr(Arrayentry(*(getattr(self, field) for field in Arrayentry._fields)))
+
+    @property
+    def pseudocodeline(self):
+        """
+        :returns: position of pseudo code line
+        """
+        return int(self.buffer_array.pseudocodelines[self.index])
+
+    @property
+    def points(self):
+        """
+        :returns: x, y coordinates of current point as array of shape (1, 2) or None
+        """
+        return _point_view(self.buffer_array.points, self.index)
+
+    @property
+    def vectors(self):
+        """
+        :returns: vectors of the form [(x, y, dx, dy), ...] as array of shape (n, 4) or None
+        """
+        return _ragged_view(self.buffer_array.vector_data, self.buffer_array.vector_offsets, self.index)
+
+    @property
+    def lines(self):
+        """
+        :returns: lines of the form [(start_x, start_y, end_x, end_y), ...] as array of shape (n, 4) or None
+        """
+        return _ragged_view(self.buffer_array.line_data, self.buffer_array.line_offsets, self.index)
+
+    @property
+    def scatterpoints_start(self):
+        """
+        :returns: index of the first scatter point shown in this frame
+        """
+        return int(self.buffer_array.scatter_starts[self.index])
+
+    @property
+    def scatterpoints_position(self):
+        """
+        :returns: end index of the scatter points shown in this frame
+        """
+        return int(self.buffer_array.scatter_positions[self.index])
+
+    @property
+    def nextpoint(self):
+        """
+        :returns: tuple of x, y coordinates of next point as array of shape (1, 2) and its color or None
+        """
+        color = self.buffer_array.nextpoint_colors[self.index]
+        if color < 0:
+            return None
+        return self.buffer_array.nextpoints[self.index:self.index + 1], self.buffer_array.colors[color]
+
+    @property
+    def lowest_point(self):
+        """
+        :returns: x, y coordinates of lowest point so far as array of shape (1, 2) or None
+        """
+        lowest_index = self.buffer_array.lowest_indices[self.index]
+        if lowest_index < 0:
+            return None
+        return self.buffer_array.lowest_points[lowest_index:lowest_index + 1]
+
+
+class BufferArray:
     """
     Creats Array with a capacity to store pseudocodeline, points, vectors,
-    lines as named tuple.
+    lines column wise in numpy arrays.
+    The capacity is doubled whenever the array is full (unless max_capacity is reached),
+    so pushing is amortized O(1) and no frames are lost.
     """
-    def __init__(self, capacity):
+    # per frame columns with their dtype, shape of one entry and fill value
+    frame_columns = (('pseudocodelines', np.int16, (), 0),
+                     ('points', np.float64, (2,), np.nan),
+                     ('nextpoints', np.float64, (2,), np.nan),
+                     ('nextpoint_colors', np.int8, (), -1),
+                     ('lowest_indices', np.int32, (), -1),
+                     ('scatter_starts', np.int32, (), 0),
+                     ('scatter_positions', np.int32, (), 0))
+    # offset columns of ragged arrays (one entry more than frames)
+    offset_columns = ('vector_offsets', 'line_offsets')
+
+    def __init__(self, capacity=256, max_capacity=None):
         """
         init
-        :param capacity: size of buffer array
+        :param capacity: initial size of buffer array
+        :param max_capacity: hard limit of frames, at least 1 (None means unlimited)
         """
+        if max_capacity is not None:
+            max_capacity = max(max_capacity, 1)
+            capacity = min(capacity, max_capacity)
         self.capacity = capacity
-        self.memory = [None for _ in range(capacity)]
-        self.scatterpoint_array = []
+        self.max_capacity = max_capacity
+        # one entry per frame
+        for name, dtype, shape, fill in self.frame_columns:
+            setattr(self, name, np.full((capacity,) + shape, fill, dtype=dtype))
+        # ragged arrays
+        for name in self.offset_columns:
+            setattr(self, name, np.zeros(capacity + 1, dtype=np.int32))
+        self.vector_data = np.empty((0, 4))
+        self.line_data = np.empty((0, 4))
+        # column of lowest points so far; a new entry is only added when the lowest point improves
+        self.lowest_points = np.empty((0, 2))
+        self.lowest_count = 0
+        # color names of next points referenced by nextpoint_colors
+        self.colors = []
+        # scatter points of all frames as rows (x, y, value); frame i shows rows scatter_starts[i] to
+        # scatter_positions[i] of them (the start is only non zero for later arrays of a merged buffer array)
+        self.scatter_data = np.empty((0, 3))
+        self.scatter_count = 0
         self.next_empty_postiton = 0
         self.current_step = 0
+        # frame index and coordinates of lowest point so far (points with non finite y are never the lowest)
         self.minimum = 0
+        self.minimum_x = None
+        self.minimum_y = np.inf
 
     def __getitem__(self, key):
         """
@@ -49,34 +187,31 @@ class BufferArray:
         :returns: key-th element in buffer array or raises IndexError if not possible
         """
         try:
-            return self.memory[key]
+            return ArrayentryView(self, self._index(key))
         except IndexError as error:
             print('index out of range', error)
 
     def __call__(self, offset=0):
         """
         return current step in buffer array as a function type
-        :param offset: can be used to check on any entry e.x. self.memory(step-1) and
+        :param offset: can be used to check on any entry e.x. self(-1) and
         :returns this
         """
-        return self.memory[self.current_step + offset]
+        return ArrayentryView(self, self._index(self.current_step + offset))
 
     def __iter__(self):
         """
         makes buffer array iterable
         :returns: iter
         """
-        return iter(self.memory)
+        return (ArrayentryView(self, index) for index in range(self.next_empty_postiton))
 
     def __str__(self):
         """
         generate string of the Array; empty positions are not note
         :returns this
         """
-        string = str(self.memory).replace("), Arrayentry(", "\n")
-        string = string.strip(", None]").strip("), None")
-        string = string.strip(", None").strip("[Arrayentry(")
-        return string
+        return "\n".join(str(entry) for entry in self)
 
     def __len__(self):
         """
@@ -84,26 +219,58 @@ class BufferArray:
         """
         return self.next_empty_postiton
 
+    @property
+    def scatterpoint_array(self):
+        """
+        :returns: view of shape (n, 3) on all scatter points pushed so far
+        """
+        return self.scatter_data[:self.scatter_count]
+
     def push(self, pseudocodeline, points, vectors, lines, scatter=None, nextpoint=None):
         """
-        write a named tuple(pseudocodeline, points,v ectors, lines) to the next empty Position
+        write pseudocodeline, points, vectors, lines to the next empty Position (raises IndexError if full).
+        Only one point per frame can be stored (raises ValueError for more), vectors and lines may vary in number
         :param pseudocodeline: position of pseudo code line
-        :param points: list of tuples of x, y coordinates of points
+        :param points: list containing one tuple of x, y coordinates of the current point (or None)
         :param vectors: vectors objects of the form: ([(x,y,dx,dy), ...])
         :param lines: line objects of the form ([(start_x,start_y,end_x,end_y), ...])
+        :param scatter: list of scatter points of the form ([(x, y, value), ...])
+        :param nextpoint: next point and its color of the form ([(x, y)], color), again only one point
         """
-        try:
-            if scatter:
-                for point in scatter:
-                    self.scatterpoint_array.append(point)
-            smaller, lowest_point = self._smaller(points, self.minimum)
-            if smaller:
-                self.minimum = self.next_empty_postiton
-            self.memory[self.next_empty_postiton] = Arrayentry(pseudocodeline, points,
-                         vectors, lines, len(self.scatterpoint_array), nextpoint, lowest_point)
-            self.next_empty_postiton = self.next_empty_postiton + 1
-        except IndexError as error:
-            print('<array full>', error)
+        position = self.next_empty_postiton
+        if position >= self.capacity:
+            self._grow(position + 1)
+        if scatter:
+            self.scatter_data = _append_rows(self.scatter_data, self.scatter_count, scatter)
+            self.scatter_count += len(scatter)
+        self.pseudocodelines[position] = pseudocodeline
+        if points:
+            x, y = _single_point(points)
+            self.points[position] = x, y
+            if y < self.minimum_y and np.isfinite(y):
+                self._push_lowest(x, y, position)
+        if nextpoint:
+            next_points, color = nextpoint
+            self.nextpoints[position] = _single_point(next_points)
+            self.nextpoint_colors[position] = self._color_index(color)
+        self.lowest_indices[position] = self.lowest_count - 1
+        self.scatter_positions[position] = self.scatter_count
+        self.vector_data = self._push_ragged(self.vector_data, self.vector_offsets, position, vectors)
+        self.line_data = self._push_ragged(self.line_data, self.line_offsets, position, lines)
+        self.next_empty_postiton = position + 1
+
+    def full(self):
+        """
+        :returns: True if max_capacity is reached and no further frame can be pushed
+        """
+        return self.max_capacity is not None and self.next_empty_postiton >= self.max_capacity
+
+    def push_frame(self, frame):
+        """
+        write a frame to the next empty Position
+        :param frame: Frame object, e.g. yielded by iter_frames of an algorithm
+        """
+        self.push(*frame)
 
     def set_last_position(self):
         """
@@ -116,7 +283,7 @@ class BufferArray:
         sets buffer array position to first position
         """
         self.current_step = 0
-    
+
     def last_position(self):
         """
         :returns last available position
@@ -125,27 +292,246 @@ class BufferArray:
 
     def get_minimum(self):
         """
-        :returns: minimal value
-        """
-        return self.minimum
-
-    def _smaller(self, points, comparing_pos):
-        """
-        :param points: list of points, consisting of x, y values
-        :param comparing_pos: x, y coordinates of comparing point
-        :returns True if the smallest y value at memory[pos].points is smaller then the
-        the smallest y value at memory[comparing_pos].points
-        """
-        if self.memory[comparing_pos]:
-            pos_smallest = float("inf")
-            comp_pos_smallest = float("inf")
-            for point in points:
-                if point[1] < pos_smallest:
-                    pos_smallest = point
-            for point in self.memory[comparing_pos].points:
-                if point[1] < comp_pos_smallest:
-                    comp_pos_smallest = point
-            smaller = pos_smallest[1] < comp_pos_smallest[1]
-            smallest_value = pos_smallest if smaller else comp_pos_smallest
-            return smaller, [smallest_value]
-        return True, None
\ No newline at end of file
+        :returns: x, y coordinates of lowest point so far or None if no point with finite y has been pushed yet
+        """
+        if not self.lowest_count:
+            return None
+        return self.minimum_x, self.minimum_y
+
+    @classmethod
+    def merge(cls, arrays):
+        """
+        concatenates several buffer arrays (e.g. independent simulated annealing chains) into one.
+        The lowest point and the scatter points of each frame stay the ones of the array it came from, the
+        minimum of the merged array is the lowest point of all of them
+        :param arrays: list of buffer arrays
+        :returns: merged buffer array
+        """
+        lengths = [len(array) for array in arrays]
+        merged = cls(sum(lengths))
+        for name, dtype, shape, fill in cls.frame_columns:
+            setattr(merged, name, np.concatenate([getattr(array, name)[:len(array)] for array in arrays]))
+        frame_offset = scatter_offset = lowest_offset = 0
+        for array, length in zip(arrays, lengths):
+            frames = slice(frame_offset, frame_offset + length)
+            merged.scatter_starts[frames] += scatter_offset
+            merged.scatter_positions[frames] += scatter_offset
+            merged.lowest_indices[frames][array.lowest_indices[:length] >= 0] += lowest_offset
+            colors = np.array([merged._color_index(color) for color in array.colors] + [-1], dtype=np.int8)
+            merged.nextpoint_colors[frames] = colors[array.nextpoint_colors[:length]]
+            if array.lowest_count and array.minimum_y < merged.minimum_y:
+                merged.minimum = frame_offset + array.minimum
+                merged.minimum_x, merged.minimum_y = array.minimum_x, array.minimum_y
+            frame_offset += length
+            scatter_offset += array.scatter_count
+            lowest_offset += array.lowest_count
+        for offsets, data in (('vector_offsets', 'vector_data'), ('line_offsets', 'line_data')):
+            setattr(merged, data, np.concatenate(
+                [getattr(array, data)[:getattr(array, offsets)[len(array)]] for array in arrays] + [np.empty((0, 4))]))
+            shifts = np.cumsum([0] + [getattr(array, offsets)[len(array)] for array in arrays])
+            setattr(merged, offsets, np.concatenate(
+                [getattr(array, offsets)[:len(array)] + shift for array, shift in zip(arrays, shifts)] + [shifts[-1:]]
+            ).astype(np.int32))
+        merged.lowest_points = np.concatenate(
+            [array.lowest_points[:array.lowest_count] for array in arrays] + [np.empty((0, 2))])
+        merged.lowest_count = lowest_offset
+        merged.scatter_data = np.concatenate(
+            [array.scatterpoint_array for array in arrays] + [np.empty((0, 3))])
+        merged.scatter_count = scatter_offset
+        merged.next_empty_postiton = frame_offset
+        return merged
+
+    def columns(self):
+        """
+        :returns: dictionary of all columns trimmed to the filled length, e.g. to be saved with np.savez
+        """
+        length = self.next_empty_postiton
+        columns = {name: getattr(self, name)[:length] for name, dtype, shape, fill in self.frame_columns}
+        columns['vector_offsets'] = self.vector_offsets[:length + 1]
+        columns['vector_data'] = self.vector_data[:self.vector_offsets[length]]
+        columns['line_offsets'] = self.line_offsets[:length + 1]
+        columns['line_data'] = self.line_data[:self.line_offsets[length]]
+        columns['lowest_points'] = self.lowest_points[:self.lowest_count]
+        columns['scatter_points'] = self.scatterpoint_array
+        return columns
+
+    @classmethod
+    def from_columns(cls, columns, colors=()):
+        """
+        creates a buffer array from columns as returned by columns(), e.g. loaded with np.load or np.memmap.
+        The columns are used as they are (not copied), so a memory mapped run is only read from disk on access
+        :param columns: dictionary of all columns
+        :param colors: color names referenced by column nextpoint_colors
+        :returns: buffer array with all frames of the columns
+        """
+        length = len(columns['pseudocodelines'])
+        array = cls(0)
+        for name, dtype, shape, fill in cls.frame_columns:
+            setattr(array, name, columns[name])
+        for name in cls.offset_columns + ('vector_data', 'line_data', 'lowest_points'):
+            setattr(array, name, columns[name])
+        array.scatter_data = columns['scatter_points']
+        array.scatter_count = len(array.scatter_data)
+        array.lowest_count = len(array.lowest_points)
+        array.colors = list(colors)
+        array.capacity = array.next_empty_postiton = length
+        if array.lowest_count:
+            # frame where the last (lowest) point was found
+            array.minimum = int(np.argmax(array.lowest_indices == array.lowest_count - 1))
+            array.minimum_x, array.minimum_y = (float(value) for value in array.lowest_points[-1])
+        return array
+
+    def load_into_memory(self):
+        """
+        replaces memory mapped columns (see from_columns) with copies in memory, which releases the file they are
+        mapped from, e.g. before it is replaced
+        """
+        names = [name for name, dtype, shape, fill in self.frame_columns] + list(self.offset_columns) + \
+            ['vector_data', 'line_data', 'lowest_points', 'scatter_data']
+        for name in names:
+            column = getattr(self, name)
+            if isinstance(column, np.memmap):
+                setattr(self, name, np.array(column))
+
+    def trim(self):
+        """
+        shrinks all columns to the actually filled length to release unused capacity.
+        Usually called when an algorithm is done with create_array
+        """
+        length = self.next_empty_postiton
+        self._resize(length)
+        self.vector_data = self.vector_data[:self.vector_offsets[length]].copy()
+        self.line_data = self.line_data[:self.line_offsets[length]].copy()
+        self.lowest_points = self.lowest_points[:self.lowest_count].copy()
+        self.scatter_data = self.scatter_data[:self.scatter_count].copy()
+
+    def _grow(self, min_capacity):
+        """
+        doubles capacity (at least to min_capacity)
+        :param min_capacity: capacity needed
+        """
+        if self.max_capacity is not None and min_capacity > self.max_capacity:
+            raise IndexError('<array full> maximal capacity of {} frames reached'.format(self.max_capacity))
+        capacity = max(2 * self.capacity, min_capacity, 16)
+        if self.max_capacity is not None:
+            capacity = min(capacity, self.max_capacity)
+        self._resize(capacity)
+
+    def _resize(self, capacity):
+        """
+        reallocates all per frame columns with new capacity, filled frames are kept
+        :param capacity: new capacity (not smaller than filled length)
+        """
+        length = self.next_empty_postiton
+        for name, dtype, shape, fill in self.frame_columns:
+            column = np.full((capacity,) + shape, fill, dtype=dtype)
+            column[:length] = getattr(self, name)[:length]
+            setattr(self, name, column)
+        for name in self.offset_columns:
+            column = np.zeros(capacity + 1, dtype=np.int32)
+            column[:length + 1] = getattr(self, name)[:length + 1]
+            setattr(self, name, column)
+        self.capacity = capacity
+
+    def _index(self, key):
+        """
+        :param key: frame index, negative values count from the last filled frame
+        :returns: non negative frame index or raises IndexError if not filled
+        """
+        length = self.next_empty_postiton
+        index = key + length if key < 0 else key
+        if not 0 <= index < length:
+            raise IndexError('frame {} of {}'.format(key, length))
+        return index
+
+    def _color_index(self, color):
+        """
+        :param color: color name
+        :returns: index of color in color table (color is added if new)
+        """
+        if color not in self.colors:
+            self.colors.append(color)
+        return self.colors.index(color)
+
+    @staticmethod
+    def _push_ragged(data, offsets, position, entries):
+        """
+        appends entries of one frame to a ragged array
+        :param data: flat data array of shape (n, 4)
+        :param offsets: offset array, offsets[position] has to be set already
+        :param position: frame index
+        :param entries: list of 4-tuples or None
+        :returns: data array (reallocated with doubled size if too small)
+        """
+        start = offsets[position]
+        count = len(entries) if entries else 0
+        if count:
+            if start + count > len(data):
+                grown = np.empty((max(2 * len(data), start + count, 16), 4))
+                grown[:start] = data[:start]
+                data = grown
+            data[start:start + count] = entries
+        offsets[position + 1] = start + count
+        return data
+
+    def _push_lowest(self, x, y, position):
+        """
+        appends a new lowest point to the lowest point column
+        :param x: x coordinate of new lowest point
+        :param y: y coordinate of new lowest point
+        :param position: frame index where it was found
+        """
+        self.lowest_points = _append_rows(self.lowest_points, self.lowest_count, [(x, y)])
+        self.lowest_count += 1
+        self.minimum = position
+        self.minimum_x = x
+        self.minimum_y = y
+
+
+def _single_point(points):
+    """
+    :param points: list containing one x, y point
+    :returns: this point or raises ValueError if there is more than one
+    """
+    if len(points) != 1:
+        raise ValueError('exactly one point per frame can be stored, got {}'.format(len(points)))
+    return points[0]
+
+
+def _append_rows(data, count, rows):
+    """
+    :param data: preallocated array, of which the first count rows are filled
+    :param count: number of filled rows
+    :param rows: rows to be written behind the filled rows
+    :returns: data array (reallocated with doubled size if too small)
+    """
+    if count + len(rows) > len(data):
+        grown = np.empty((max(2 * len(data), count + len(rows), 16),) + data.shape[1:])
+        grown[:count] = data[:count]
+        data = grown
+    data[count:count + len(rows)] = rows
+    return data
+
+
+def _point_view(column, index):
+    """
+    :param column: point column of shape (n, 2)
+    :param index: frame index
+    :returns: view of shape (1, 2) on the point or None if not set
+    """
+    if np.isnan(column[index, 0]):
+        return None
+    return column[index:index + 1]
+
+
+def _ragged_view(data, offsets, index):
+    """
+    :param data: flat data array of a ragged array
+    :param offsets: offset array of a ragged array
+    :param index: frame index
+    :returns: view on all entries of the frame or None if there are none
+    """
+    start, end = offsets[index], offsets[index + 1]
+    if start == end:
+        return None
+    return data[start:end]
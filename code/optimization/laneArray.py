@@ -0,0 +1,123 @@
+"""
+Lane Array class.
+Stores the trajectories of many runs of one algorithm (lanes) which are advanced in lockstep from different start
+points, e.g. by GradientDescent.create_lanes. Row i holds the x, y coordinates of all lanes after step i; lanes that
+have already stopped keep their last position.
+"""
+
+
+########### IMPORTS ###########
+#<editor-fold desc="Open">
+
+# packages
+import collections
+import numpy as np
+
+#</editor-fold>
+########### IMPORTS ###########
+
+
+Basin = collections.namedtuple('Basin', ('x', 'y', 'count'))
+
+
+class LaneArray:
+    """
+    Creats Array of x, y coordinates of shape (steps, lanes) that doubles its capacity when full
+    """
+    def __init__(self, startpoints, start_values, capacity=64, max_capacity=None):
+        """
+        init
+        :param startpoints: numpy array of x coordinates of all start points
+        :param start_values: numpy array of y coordinates of all start points
+        :param capacity: initial number of steps
+        :param max_capacity: hard limit of steps including the start points (None means unlimited)
+        """
+        self.lanes = len(startpoints)
+        self.max_capacity = max_capacity
+        self.capacity = capacity if max_capacity is None else min(capacity, max_capacity)
+        self.xs = np.empty((self.capacity, self.lanes))
+        self.ys = np.empty((self.capacity, self.lanes))
+        # number of steps taken by each lane and whether a lane stopped as its y value did not change anymore
+        self.steps = np.zeros(self.lanes, dtype=np.int32)
+        self.converged = np.zeros(self.lanes, dtype=bool)
+        self.next_empty_postiton = 0
+        self.push(startpoints, start_values)
+
+    def __len__(self):
+        """
+        :returns: number of filled rows (start points included)
+        """
+        return self.next_empty_postiton
+
+    def push(self, x, y):
+        """
+        write the current x, y coordinates of all lanes to the next empty row
+        :param x: numpy array of x coordinates of all lanes
+        :param y: numpy array of y coordinates of all lanes
+        """
+        position = self.next_empty_postiton
+        if position >= self.capacity:
+            self._grow(position + 1)
+        self.xs[position] = x
+        self.ys[position] = y
+        self.next_empty_postiton = position + 1
+
+    def trajectory(self, lane):
+        """
+        :param lane: lane index
+        :returns: x and y coordinates of all steps of the lane as numpy arrays
+        """
+        end = self.steps[lane] + 1
+        return self.xs[:end, lane], self.ys[:end, lane]
+
+    def final_points(self):
+        """
+        :returns: x and y coordinates of the last position of all lanes as numpy arrays
+        """
+        return self.xs[self.next_empty_postiton - 1], self.ys[self.next_empty_postiton - 1]
+
+    def basins(self, decimals=2):
+        """
+        summarizes where the lanes ended up. Final x coordinates that are equal after rounding count
+        as the same basin. Lanes with non finite final coordinates are left out
+        :param decimals: number of decimals final x coordinates are rounded to
+        :returns: list of Basin(x, y, count) sorted by y
+        """
+        x, y = self.final_points()
+        finite = np.isfinite(x) & np.isfinite(y)
+        rounded = np.round(x[finite], decimals)
+        centers, inverse, counts = np.unique(rounded, return_inverse=True, return_counts=True)
+        lowest = np.full(len(centers), np.inf)
+        np.minimum.at(lowest, inverse, y[finite])
+        order = np.argsort(lowest)
+        return [Basin(float(centers[i]), float(lowest[i]), int(counts[i])) for i in order]
+
+    def trim(self):
+        """
+        shrinks the arrays to the filled rows to release unused capacity
+        """
+        self._resize(self.next_empty_postiton)
+
+    def _grow(self, min_capacity):
+        """
+        doubles capacity (at least to min_capacity)
+        :param min_capacity: capacity needed
+        """
+        if self.max_capacity is not None and min_capacity > self.max_capacity:
+            raise IndexError('<array full> maximal capacity of {} steps reached'.format(self.max_capacity))
+        capacity = max(2 * self.capacity, min_capacity)
+        if self.max_capacity is not None:
+            capacity = min(capacity, self.max_capacity)
+        self._resize(capacity)
+
+    def _resize(self, capacity):
+        """
+        reallocates both arrays with new capacity, filled rows are kept
+        :param capacity: new capacity (not smaller than filled length)
+        """
+        length = self.next_empty_postiton
+        for name in ('xs', 'ys'):
+            array = np.empty((capacity, self.lanes))
+            array[:length] = getattr(self, name)[:length]
+            setattr(self, name, array)
+        self.capacity = capacity
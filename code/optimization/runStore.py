@@ -0,0 +1,153 @@
+"""
+Run Store.
+Saves computed buffer arrays ("runs") to disk and loads them again, e.g. to replay a run in the GUI later on.
+
+A run file consists of
+    - the magic bytes b'NOVIZRUN' and the length of the header as little endian uint32
+    - a JSON header with objective function, coefficients, algorithm, parameters, seed (of the random generator
+      of the algorithm; null if the run was not seeded), start point, colors of the next points and dtype, shape
+      and byte offset of every column
+    - the columns of the buffer array (see BufferArray.columns) as raw binary data, each aligned to ALIGNMENT bytes
+
+Columns are loaded with np.memmap by default, so frames are only read from disk when they are shown and runs with
+millions of frames can be scrubbed without loading them into memory.
+"""
+
+
+########### IMPORTS ###########
+#<editor-fold desc="Open">
+
+# packages
+import json
+import os
+import struct
+import numpy as np
+
+# files from optimization
+from .bufferArray import BufferArray
+
+#</editor-fold>
+########### IMPORTS ###########
+
+
+MAGIC = b'NOVIZRUN'
+VERSION = 1
+# byte alignment of header end and columns
+ALIGNMENT = 64
+# file extension of run files
+EXTENSION = '.noviz'
+
+
+def save_run(path, array, function_name, coeffs, method_name, params, startpoint, seed=None):
+    """
+    writes a buffer array and everything needed to reproduce it to a run file
+    :param path: file path
+    :param array: computed buffer array
+    :param function_name: name of objective function in ObjectiveFunctions
+    :param coeffs: objective function coefficients as list
+    :param method_name: name of algorithm in Algorithms
+    :param params: algorithm parameters as list
+    :param startpoint: start point as x coordinate
+    :param seed: seed of the random generator of the algorithm (None if not seeded)
+    :return: header as dictionary
+    """
+    # a loaded run saved to its own path: path is replaced below, which is not possible (Windows) or not safe while
+    # it is memory mapped, so the columns are read into memory first
+    if _mapped_from(array, path):
+        array.load_into_memory()
+    columns = {name: np.ascontiguousarray(column) for name, column in array.columns().items()}
+    header = {"version": VERSION,
+              "function": function_name,
+              "coeffs": np.asarray(coeffs, dtype=float).tolist(),
+              "method": method_name,
+              "params": [float(param) for param in params],
+              "seed": seed,
+              "startpoint": float(startpoint),
+              "frames": len(array),
+              "colors": list(array.colors),
+              "columns": {}}
+
+    # column offsets depend on header length, which depends on column offsets (usually stable after one pass)
+    header_length = 0
+    while True:
+        offset = _align(len(MAGIC) + 4 + header_length)
+        for name, column in columns.items():
+            header["columns"][name] = {"dtype": column.dtype.str, "shape": list(column.shape), "offset": offset}
+            offset = _align(offset + column.nbytes)
+        encoded = json.dumps(header).encode('utf-8')
+        if len(encoded) <= header_length:
+            break
+        header_length = len(encoded)
+    encoded = encoded.ljust(header_length)
+
+    # written to a temporary file first, which replaces path when complete, so path is never left half written
+    temporary = path + '.tmp'
+    try:
+        with open(temporary, 'wb') as file:
+            file.write(MAGIC + struct.pack('<I', header_length) + encoded)
+            for name, column in columns.items():
+                file.write(b'\0' * (header["columns"][name]["offset"] - file.tell()))
+                file.write(column.tobytes())
+        os.replace(temporary, path)
+    except BaseException:
+        if os.path.exists(temporary):
+            os.remove(temporary)
+        raise
+    return header
+
+
+def load_header(path):
+    """
+    :param path: file path of a run file
+    :return: header of run file as dictionary or raises ValueError if it is no run file
+    """
+    with open(path, 'rb') as file:
+        start = file.read(len(MAGIC) + 4)
+        if len(start) < len(MAGIC) + 4 or start[:len(MAGIC)] != MAGIC:
+            raise ValueError("'{}' is not a run file".format(path))
+        header_length, = struct.unpack('<I', start[len(MAGIC):])
+        header = json.loads(file.read(header_length).decode('utf-8'))
+    if header.get("version") != VERSION:
+        raise ValueError("run file version {} is not supported".format(header.get("version")))
+    return header
+
+
+def load_run(path, mmap=True):
+    """
+    loads a run file
+    :param path: file path of a run file
+    :param mmap: if True columns are memory mapped (read only), otherwise read into memory
+    :return: header as dictionary and buffer array of the run
+    """
+    header = load_header(path)
+    columns = {}
+    for name, column in header["columns"].items():
+        dtype, shape = np.dtype(column["dtype"]), tuple(column["shape"])
+        if mmap and np.prod(shape) > 0:
+            columns[name] = np.memmap(path, dtype=dtype, mode='r', offset=column["offset"], shape=shape)
+        else:
+            with open(path, 'rb') as file:
+                file.seek(column["offset"])
+                data = file.read(dtype.itemsize * int(np.prod(shape)))
+            columns[name] = np.frombuffer(data, dtype=dtype).reshape(shape).copy()
+    return header, BufferArray.from_columns(columns, header["colors"])
+
+
+def _mapped_from(array, path):
+    """
+    :param array: buffer array
+    :param path: file path
+    :return: True if any column of the buffer array is memory mapped from the file at path
+    """
+    if not os.path.exists(path):
+        return False
+    return any(isinstance(column, np.memmap) and column.filename is not None and
+               os.path.samefile(column.filename, path) for column in array.columns().values())
+
+
+def _align(offset):
+    """
+    :param offset: byte offset
+    :return: next offset that is a multiple of ALIGNMENT
+    """
+    return -(-offset // ALIGNMENT) * ALIGNMENT
@@ -3,6 +3,8 @@ Module Visualizatuion
 
 Submodule plotcanvas: Handles initiation and alteration of plotcanvas object, instansiated in moldule gui
 Submodule navigation: Handles drag'n'drop and toolbar options
+Submodule playback: Schedules play animation with a targeted frame rate
+Submodule sampling: Adaptive sampling of objective function curves
 
 Lukas Müller: lukas.mueller-1@studium.uni-hamburg.de
 '''
@@ -10,3 +12,4 @@ Lukas Müller: lukas.mueller-1@studium.uni-hamburg.de
 
 from .plotcanvas import PlotCanvas
 from .navigation import CustomNavigationToolbar
+from .playback import Playback, speed_to_fps
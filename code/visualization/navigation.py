@@ -3,6 +3,9 @@ Navigation submodule.
 
 handles zooms and drag'n'drop events, invoked in plotcanvas and returns
 new axes limits with corresponding function.
+Events only set the new axes limits. Redraws are coalesced to at most one per display frame,
+which shows a cheap interim curve (coarse samples), the full resolution curve is sampled once
+input settles (no event for SETTLE_INTERVAL milliseconds or drop).
 
 It also contains an custom version of the default matplotlib toolbar.
 """
@@ -13,12 +16,65 @@ It also contains an custom version of the default matplotlib toolbar.
 
 # packages
 import types
+from PyQt5.QtCore import QTimer
 from matplotlib.backends.backend_qt5agg import NavigationToolbar2QT as NaviToolB
 
 #</editor-fold>
 ########### IMPORTS ###########
 
 
+# milliseconds between coalesced redraws while navigating (one display frame)
+FRAME_INTERVAL = 16
+# milliseconds without navigation event until the curve is sampled in full resolution
+SETTLE_INTERVAL = 100
+
+
+def init_navigation(canvas_object):
+    """
+    creates the timers of coalesced redraws and mouse coordinate updates
+    :param canvas_object: plot canvas object
+    """
+    canvas_object.navigation_pending = False
+    canvas_object.frame_timer = QTimer(canvas_object)
+    canvas_object.frame_timer.setSingleShot(True)
+    canvas_object.frame_timer.setInterval(FRAME_INTERVAL)
+    canvas_object.frame_timer.timeout.connect(lambda: redraw(canvas_object, interim=True))
+    canvas_object.settle_timer = QTimer(canvas_object)
+    canvas_object.settle_timer.setSingleShot(True)
+    canvas_object.settle_timer.setInterval(SETTLE_INTERVAL)
+    canvas_object.settle_timer.timeout.connect(lambda: redraw(canvas_object))
+    canvas_object.coords_timer = QTimer(canvas_object)
+    canvas_object.coords_timer.setSingleShot(True)
+    canvas_object.coords_timer.setInterval(FRAME_INTERVAL)
+    canvas_object.coords_timer.timeout.connect(
+        lambda: canvas_object.mouse_coords.emit(canvas_object.current_x, canvas_object.current_y))
+
+
+def request_redraw(canvas_object):
+    """
+    schedules redraw after axes limits changed: an interim one with the next display frame
+    (if none is scheduled yet) and a full resolution one after input settled
+    :param canvas_object: plot canvas object
+    """
+    canvas_object.navigation_pending = True
+    if not canvas_object.frame_timer.isActive():
+        canvas_object.frame_timer.start()
+    canvas_object.settle_timer.start()
+
+
+def redraw(canvas_object, interim=False):
+    """
+    updates curve for current axes limits and redraws canvas
+    :param canvas_object: plot canvas object
+    :param interim: True for cheap coarse curve while navigating, False for full resolution
+    """
+    if not interim:
+        canvas_object.frame_timer.stop()
+        canvas_object.settle_timer.stop()
+        canvas_object.navigation_pending = False
+    canvas_object.update_figure_plot(interim=interim)
+
+
 def zoom(canvas_object, event):
     """
     Zoom function handles mouse wheel scrolls and refreshes plot
@@ -43,12 +99,8 @@ def zoom(canvas_object, event):
     else:  # event.button == 'down':
         canvas_object.axes.drag_pan(3, event.key, event.x - 20, event.y - 20)
 
-    # update curve
-    canvas_object.update_figure_plot()
-
-    # display zoom
-    fig = canvas_object.axes.get_figure()
-    fig.canvas.draw_idle()
+    # display zoom with the next frame
+    request_redraw(canvas_object)
 
 
 def drag(canvas_object, event):
@@ -77,8 +129,11 @@ def drop(canvas_object):
     """
     # "unpress"
     canvas_object.press = None
-    # refresh canvas
-    canvas_object.axes.figure.canvas.draw()
+    # refresh canvas, curve in full resolution right away if moved
+    if canvas_object.navigation_pending:
+        redraw(canvas_object)
+    else:
+        canvas_object.axes.figure.canvas.draw()
 
 
 def move(canvas_object, event):
@@ -109,17 +164,13 @@ def move(canvas_object, event):
     canvas_object.axes.set_xlim(canvas_object.cur_xlim)
     canvas_object.axes.set_ylim(canvas_object.cur_ylim)
 
-    # update curve
-    canvas_object.update_figure_plot()
-
-    # draw new virtual x/y-lims
-    canvas_object.axes.figure.canvas.draw()
-    canvas_object.axes.figure.canvas.flush_events()
+    # draw new virtual x/y-lims with the next frame
+    request_redraw(canvas_object)
 
 
 def print_mouse_coords(canvas_object, event):
     """
-    sets x, y coordinates of event on
+    sets x, y coordinates of event on canvas object and emits them (signal mouse_coords) with the next frame
     :param canvas_object: plot canvas object
     :param event: mouse click event object containing x, y coordinates
     """
@@ -128,6 +179,8 @@ def print_mouse_coords(canvas_object, event):
     if x and y:
         canvas_object.current_x = x
         canvas_object.current_y = y
+        if not canvas_object.coords_timer.isActive():
+            canvas_object.coords_timer.start()
 
 
 class CustomNavigationToolbar(NaviToolB):
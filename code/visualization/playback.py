@@ -0,0 +1,130 @@
+"""
+Playback submodule.
+
+Schedules the play animation of a computed buffer array with one QTimer targeting a frame rate.
+Frames that are due but could not be rendered in time (e.g. because rendering is slower than the
+frame rate) are skipped instead of slowing the animation down.
+"""
+
+
+########### IMPORTS ###########
+# <editor-fold desc="Open">
+
+# packages
+import math
+import time
+from PyQt5.QtCore import QObject, QTimer, Qt, pyqtSignal
+
+# </editor-fold>
+########### IMPORTS ###########
+
+
+# frame rates of speed slider (value 0 to 99, logarithmic in between)
+MIN_FPS = 1
+MAX_FPS = 1000
+# maximal number of timer ticks per second; faster frame rates advance several frames per tick
+MAX_TICK_RATE = 60
+
+
+def speed_to_fps(speed, maximum=99):
+    """
+    maps speed slider value logarithmically to frames per second
+    :param speed: slider value between 0 and maximum
+    :param maximum: maximal slider value
+    :return: frames per second (MIN_FPS for 0, MAX_FPS for maximum)
+    """
+    return MIN_FPS * (MAX_FPS / MIN_FPS) ** (speed / maximum)
+
+
+class Playback(QObject):
+    """
+    Playback scheduler. While running, it emits 'advance' with the number of frames to proceed,
+    so that the animation keeps up with fps no matter how long rendering a frame takes.
+
+    example:
+        playback = Playback(fps=30)
+        playback.advance.connect(lambda frames: canvas.update_one_step("next", steps=frames))
+        playback.start()
+    """
+    advance = pyqtSignal(int)
+
+    def __init__(self, fps=30, parent=None):
+        """
+        init
+        :param fps: targeted frames per second
+        :param parent: parent QObject
+        """
+        super(Playback, self).__init__(parent)
+        self.timer = QTimer(self)
+        self.timer.setTimerType(Qt.PreciseTimer)
+        self.timer.timeout.connect(self._tick)
+        self.fps = fps
+        # time and number of frames played since (re)start at current fps
+        self.start_time = None
+        self.frames_played = 0
+        self.frames_skipped = 0
+
+    @property
+    def fps(self):
+        """
+        :return: targeted frames per second
+        """
+        return self._fps
+
+    @fps.setter
+    def fps(self, fps):
+        """
+        sets frames per second and the timer interval; a running playback continues at the new rate
+        :param fps: frames per second
+        """
+        self._fps = max(fps, MIN_FPS / 10)
+        self.timer.setInterval(int(round(1000 * self.frames_per_tick / self._fps)))
+        if self.is_active():
+            self._restart_clock()
+
+    @property
+    def frames_per_tick(self):
+        """
+        :return: number of frames advanced per timer tick if rendering keeps up
+        """
+        return max(1, math.ceil(self._fps / MAX_TICK_RATE))
+
+    def is_active(self):
+        """
+        :return: True if playback is running
+        """
+        return self.timer.isActive()
+
+    def start(self):
+        """
+        starts playback, the first frame is advanced immediately
+        """
+        self.frames_skipped = 0
+        self._restart_clock()
+        self.timer.start()
+        self._tick()
+
+    def stop(self):
+        """
+        stops playback
+        """
+        self.timer.stop()
+
+    def _restart_clock(self):
+        """
+        frames are counted from now on
+        """
+        self.start_time = time.perf_counter()
+        self.frames_played = 0
+
+    def _tick(self):
+        """
+        emits the number of frames due since the last tick (nothing if none is due yet)
+        """
+        due = int((time.perf_counter() - self.start_time) * self._fps) + 1
+        frames = due - self.frames_played
+        if frames <= 0:
+            return
+        self.frames_skipped += max(frames - self.frames_per_tick, 0)
+        self.frames_played += frames
+        self.advance.emit(frames)
@@ -10,15 +10,21 @@ instantiated in gui.function_parser
 # <editor-fold desc="Open">
 
 # packages
+from contextlib import contextmanager
 import numpy as np
+from PyQt5.QtCore import pyqtSignal
 from PyQt5.QtWidgets import QSizePolicy
-from PyQt5.QtCore import QEventLoop, QTimer
 from matplotlib.backends.backend_qt5agg import FigureCanvas
 from matplotlib.figure import Figure
+from matplotlib.collections import LineCollection, PolyCollection
 import matplotlib.pyplot as plt
 
 # files from visualization
-from .navigation import zoom, drag, drop, move
+from .navigation import init_navigation, zoom, drag, drop, move
+from .sampling import CurveSampler
+
+# modules from project
+from objective_functions import cached
 
 # </editor-fold>
 ########### IMPORTS ###########
@@ -28,7 +34,10 @@ class PlotCanvas(FigureCanvas):
     """
     Plotcanvas class, inherits from matplotlib's FigureCanvas class
     and extends it with specific methods and attributes.
+    Emits 'mouse_coords' (x, y) when the mouse moved in plot, at most once per frame.
     """
+    mouse_coords = pyqtSignal(float, float)
+
     def __init__(self, parent=None, width=5, height=4, dpi=100):
         """
         init
@@ -45,6 +54,8 @@ class PlotCanvas(FigureCanvas):
 
         # Algorithm buffer array (self.Algorithm.array)
         self.algorithm = None
+        # objective function of algorithm with cached scalar calls (see _objective_function)
+        self.cached_function = None
 
         # init of matplotlib figure, axes and canvas
         self._init_matplotlib_objects()
@@ -55,8 +66,12 @@ class PlotCanvas(FigureCanvas):
         # init spinbox_currentposition
         self.spinbox_currentposition = None
 
-        # init colorbar
+        # init colorbar and its normalization (vmin, vmax)
         self.colorbar = None
+        self.colorbar_norm = None
+
+        # init blitting of animated plot objects
+        self._init_blitting()
 
         # save plot and plot objects
         self._plot_inits()
@@ -70,12 +85,12 @@ class PlotCanvas(FigureCanvas):
         """
         # interpolated points
         self.points_for_interpolation = []
-        # sleep time for play animation
-        self.sleep_time = 500
         # tracing
         self.tracing_switch = False
         self.current_points = None
         self.zoom = 5
+        # adaptive sampler of curve (see update_figure_plot)
+        self.sampler = None
         # xy coords
         self.current_x = 0.0
         self.current_y = 0.0
@@ -88,6 +103,8 @@ class PlotCanvas(FigureCanvas):
         :param Algorithm: Algorithm object from optimization.algorithms
         """
         self.algorithm = Algorithm
+        # frames of new algorithm are not related to drawn frames
+        self._frame_data = {}
 
 ###########################################
 #  init plotcanvas objects and functions  #
@@ -100,10 +117,12 @@ class PlotCanvas(FigureCanvas):
         self.curve = self._init_curve()
         self.points = self._init_points()
         self.scatter_points = None  # init needed in Algorithm because of colormap scale (self._init_scatter_points())
-        self.vectors = []
-        self.lines = []
+        self.vectors = self._init_vectors()
+        self.lines = self._init_lines()
         self.lowest_point = self._init_lowestpoint()
         self.nextpoint = self._init_nextpoint()
+        # data of last drawn frame for every plot object (see _changed)
+        self._frame_data = {}
 
     def _init_dragndrop(self):
         """
@@ -116,6 +135,7 @@ class PlotCanvas(FigureCanvas):
         self.y0 = None
         self.x1 = None
         self.y1 = None
+        init_navigation(self)
         self.fig.canvas.mpl_connect('button_press_event', lambda event: drag(self, event))
         self.fig.canvas.mpl_connect('button_release_event', lambda event: drop(self))
         self.fig.canvas.mpl_connect('motion_notify_event', lambda event: move(self, event))
@@ -123,6 +143,19 @@ class PlotCanvas(FigureCanvas):
         # init mouse wheel zoom
         self.fig.canvas.mpl_connect('scroll_event', lambda event: zoom(self, event))
 
+    def _init_blitting(self):
+        """
+        Plot objects that change from frame to frame (points, vectors, lines, ...) are animated artists.
+        They are not part of a full draw, which only renders the static background (axes, grid, curve).
+        The background is cached after every full draw and each frame only draws the animated artists on
+        a copy of it (blit) instead of redrawing the whole figure.
+        """
+        self.background = None
+        self.fig.canvas.mpl_connect('draw_event', self._on_draw)
+        # batched update transaction (see frame_update)
+        self._update_depth = 0
+        self._dirty = False
+
     def _init_matplotlib_objects(self):
         """
         primary initialisation of matplotlib canvas objects
@@ -170,32 +203,55 @@ class PlotCanvas(FigureCanvas):
         """
         :return: empty set of points
         """
-        return self.axes.plot([], [], color='#339966', marker='o', linestyle='dashed', markersize=5)[0]
+        return self.axes.plot([], [], color='#339966', marker='o', linestyle='dashed', markersize=5,
+                              animated=True)[0]
 
     def _init_scatter_points(self):
         if self.algorithm.scatter:
             colormap_name = self.algorithm.scatter_colormapname
             minimum = self.algorithm.scatter_min
             maximum = self.algorithm.scatter_max
-            self.scatter_points = self.axes.scatter([0, 0], [0, 0], marker='o',
+            self.scatter_points = self.axes.scatter([0, 0], [0, 0], marker='o', animated=True,
                                                     c=[minimum, maximum], cmap=plt.get_cmap(colormap_name))
 
             if self.colorbar is None:
                 self.colorbar = self.fig.colorbar(self.scatter_points)
             else:
                 self.fig.get_axes()[1].set_visible(False)
+            # colorbar is part of the background
+            self.background = None
+            # colorbar is linked to the new scatter points with the first update
+            self.colorbar_norm = None
+
+    def _init_vectors(self):
+        """
+        :return: empty collection of vectors (arrows), reused for every frame
+        """
+        vectors = PolyCollection([], facecolors='lightblue', edgecolors='black', animated=True)
+        self.axes.add_collection(vectors, autolim=False)
+        return vectors
+
+    def _init_lines(self):
+        """
+        :return: empty collection of lines, reused for every frame
+        """
+        lines = LineCollection([], colors='g', linestyles='dashed', animated=True)
+        self.axes.add_collection(lines, autolim=False)
+        return lines
 
     def _init_nextpoint(self):
         """
         :return: empty set of points
         """
-        return self.axes.plot([], [], color='black', marker='x', linestyle='dashed', markersize=10)[0]
+        return self.axes.plot([], [], color='black', marker='x', linestyle='dashed', markersize=10,
+                              animated=True)[0]
 
     def _init_lowestpoint(self):
         """
         :return: empty set of points
         """
-        return self.axes.plot([], [], color='c', marker='*', linestyle='dashed', markersize=6)[0]
+        return self.axes.plot([], [], color='c', marker='*', linestyle='dashed', markersize=6,
+                              animated=True)[0]
 
 #############################
 # update plotcanvas objects #
@@ -203,62 +259,59 @@ class PlotCanvas(FigureCanvas):
 
     def show_plot(self):
         """
-        sets all necessary updates and flushes them
+        sets all necessary updates of the current frame and draws them at once
 
         """
+        frame = self.algorithm.array()
+        with self.frame_update():
+            if frame.lowest_point is not None:
+                self.current_points = frame.lowest_point
+                self._update_lowest_point(self.current_points)
+            else:
+                self._update_lowest_point([])
 
-        if self.algorithm.array().lowest_point:
-            self.current_points = self.algorithm.array().lowest_point
-            self._update_lowest_point(self.current_points)
-        else:
-            self._update_lowest_point([])
-        
-        if self.algorithm.array().nextpoint:
-            self.current_points = self.algorithm.array().nextpoint
-            self._update_nextpoint(self.current_points)
-        else:
-            self._update_nextpoint([(), 'black'])
+            if frame.nextpoint is not None:
+                self.current_points = frame.nextpoint
+                self._update_nextpoint(self.current_points)
+            else:
+                self._update_nextpoint([(), 'black'])
 
-        # change plot with new x, y values (points)
-        if self.algorithm.array().points:
-            self.current_points = self.algorithm.array().points
-            self._update_figure_points(self.current_points)
-        else:
-            self._update_figure_points([])
+            # change plot with new x, y values (points)
+            if frame.points is not None:
+                self.current_points = frame.points
+                self._update_figure_points(self.current_points)
+            else:
+                self._update_figure_points([])
 
-        # change plot with new vectors
-        if self.algorithm.array().vectors:
-            vectors = self.algorithm.array().vectors
-            self._update_figure_vectors(vectors)
-        else:
-            self._update_figure_vectors([])
+            # change plot with new vectors
+            if frame.vectors is not None:
+                vectors = frame.vectors
+                self._update_figure_vectors(vectors)
+            else:
+                self._update_figure_vectors([])
 
-        # change plot with new lines
-        if self.algorithm.array().lines:
-            lines = self.algorithm.array().lines
-            self._update_figure_lines(lines)
-        else:
-            self._update_figure_lines([])
+            # change plot with new lines
+            if frame.lines is not None:
+                lines = frame.lines
+                self._update_figure_lines(lines)
+            else:
+                self._update_figure_lines([])
 
-        if self.algorithm.array().scatterpoints_position:
-            scatterpos= self.algorithm.array().scatterpoints_position
-            self.update_figure_scatter_points(scatterpos)
-        else:
-            self.update_figure_scatter_points(0, clear=True)
+            if frame.scatterpoints_position > frame.scatterpoints_start:
+                scatterpos= frame.scatterpoints_position
+                self._update_figure_scatter_points(scatterpos, start=frame.scatterpoints_start)
+            else:
+                self._update_figure_scatter_points(0, clear=True)
 
-    def update_one_step(self, direction, play=False):
+    def update_one_step(self, direction, steps=1):
         """
-        updates plot canvas and all other plot objects for one step in
+        updates plot canvas and all other plot objects for one step (or several steps at once) in
         given diretion. Used for next/previous and play button.
         :param direction: direction of update related to buffer array (next or previous)
-        :param play: determines if called from animation or one/last/first step call
+        :param steps: number of steps, frames in between are skipped (used by playback to keep up its frame rate)
         :return: current pseudocode position
         """
 
-        if play:
-            # sleep to make animation slower or faster
-            self._sleep()
-
         if self.tracing_switch and self.current_points is not None:
             # traces current main point
             self._trace_current_focus()
@@ -266,9 +319,11 @@ class PlotCanvas(FigureCanvas):
 
         if self._check_boundaries(direction):
             if direction == "next":   # forwards
-                self.algorithm.array.current_step += 1
+                steps = min(steps, len(self.algorithm.array) - 1 - self.algorithm.array.current_step)
+                self.algorithm.array.current_step += steps
             else:  # backwards
-                self.algorithm.array.current_step -= 1
+                steps = min(steps, self.algorithm.array.current_step)
+                self.algorithm.array.current_step -= steps
 
             # spinbox
             self.spinbox_currentposition.setValue(self.algorithm.array.current_step + 1)
@@ -283,113 +338,119 @@ class PlotCanvas(FigureCanvas):
         else:
             return None
 
-    def update_figure_plot(self, reset=False, ObjectiveFunction=None):
+    def update_figure_plot(self, reset=False, ObjectiveFunction=None, interim=False):
         """
         updates figure curve with newly set limits.
         Called for example by navigation.
         :param reset: determines if function call has been made from reset button
         :param ObjectiveFunction: = none means, that no funcion has been chosen yet
+        :param interim: only sample coarse curve (cheap, while navigating)
         """
         if not(ObjectiveFunction or self.algorithm) or reset:
             x, y = (0, 0)
         else:
-            # get x values for newly set limits
-            x = np.linspace(self.axes.get_xlim()[0], self.axes.get_xlim()[1], 1000)
-            # get y values from current algorithm
-            if ObjectiveFunction:
-                y = ObjectiveFunction(x)
-            else:
-                y = self.algorithm.ObjectiveFunction(x)
-
-        # draw calculated x/y values
+            # get objective function of current algorithm
+            if not ObjectiveFunction:
+                ObjectiveFunction = self._objective_function()
+            # get x, y values for newly set limits (adaptive to curvature and plot size)
+            x, y = self._get_sampler(ObjectiveFunction).sample(self.axes.get_xlim(), self.axes.get_ylim(),
+                                                               (self.axes.bbox.width, self.axes.bbox.height),
+                                                               refine=not interim)
+
+        # draw calculated x/y values (curve is part of the background)
         self.curve.set_data(x, y)
+        self.background = None
         self.curve.figure.canvas.draw_idle()
         self.fig.canvas.flush_events()
 
+    def _get_sampler(self, ObjectiveFunction):
+        """
+        :param ObjectiveFunction: objective function to be plotted
+        :return: curve sampler of objective function (new one if the function changed, to reuse cached values)
+        """
+        if self.sampler is None or self.sampler.function != ObjectiveFunction.evaluate:
+            self.sampler = CurveSampler(ObjectiveFunction.evaluate)
+        return self.sampler
+
     def _update_figure_points(self, points):
         """
         updates points in plot
         :param points: contains x, y coordinates of to be added points
         """
+        if not self._changed('points', points):
+            return
         x_array, y_array = [], []
         for x, y in points:
             x_array.append(x)
             y_array.append(y)
         self.points.set_data(x_array, y_array)
-        self.points.figure.canvas.draw_idle()
-        self.fig.canvas.flush_events()
 
     def update_figure_scatter_points(self, position, clear=False):
+        """
+        updates scatter points in plot and draws them
+        :param position: current position in buffer array
+        :param clear: boolean to remove scatter points
+        """
+        with self.frame_update():
+            self._update_figure_scatter_points(position, clear)
+
+    def _update_figure_scatter_points(self, position, clear=False, start=0):
         """
         updates scatter points in plot
         :param position: current position in buffer array
         :param clear: boolean to remove scatter points
+        :param start: index of first scatter point to be shown (e.g. first of a chain in a merged buffer array)
         """
         if clear or position == 0:
+            # already cleared in last frame
+            if not self._changed('scatter_points', 0) and self.scatter_points is not None:
+                return
             if self.scatter_points:
                 self.scatter_points.remove()
             self._init_scatter_points()
-        else:
-            points = np.array(self.algorithm.array.scatterpoint_array)[:position, :2]
-            c = np.array(self.algorithm.array.scatterpoint_array)[:position, 2]
-            self.scatter_points.set_offsets(points)
-            self.scatter_points.set_array(c)
-            self.colorbar.update_bruteforce(self.scatter_points)
-            self.fig.get_axes()[1].set_visible(True)
-
-        self.points.figure.canvas.draw_idle()
-        self.fig.canvas.flush_events()
+        elif self._changed('scatter_points', start, position):
+            # views on the scatter points of the buffer array, no copy of the scatter history
+            scatter_points = self.algorithm.array.scatterpoint_array[start:position]
+            self.scatter_points.set_offsets(scatter_points[:, :2])
+            self.scatter_points.set_array(scatter_points[:, 2])
+            # colorbar only needs an update if the normalization changed
+            norm = (self.scatter_points.norm.vmin, self.scatter_points.norm.vmax)
+            if norm != self.colorbar_norm:
+                self.colorbar_norm = norm
+                self.colorbar.update_normal(self.scatter_points)
+                self.background = None
+            if not self.fig.get_axes()[1].get_visible():
+                # colorbar is part of the background
+                self.fig.get_axes()[1].set_visible(True)
+                self.background = None
 
     def _update_figure_vectors(self, vectors):
         """
         updates vectors in plot
         :param vectors: arrow coords from (x, y) to (x+dx, y+dy).
         """
-        # delete old vectors
-        for old_vector in self.vectors:
-            old_vector.remove()
-        # create new vectors
-        self.vectors = []
-
-        for x, y, dx, dy in vectors:
-            arrow_length = np.sqrt(dx ** 2 + dy ** 2)
-            axes_length = self.axes.get_ylim()[1] - self.axes.get_ylim()[0]
-            if arrow_length > axes_length * 0.1:
-                arrow_width = 0.008 * axes_length
-                arrow_head_length = 0.2
-            else:
-                arrow_width = 0.2 * arrow_length
-                arrow_head_length = arrow_length * 0.3
-            arrow_head_width = arrow_width * 3
-            self.vectors.append(self.axes.arrow(x, y, dx, dy,
-                                                length_includes_head=True,
-                                                width=arrow_width,
-                                                head_length=arrow_head_length,
-                                                head_width=arrow_head_width,
-                                                fc='lightblue', ec='black'))
-        self.curve.figure.canvas.draw_idle()
-        self.fig.canvas.flush_events()
+        # arrow size depends on y limits
+        if not self._changed('vectors', vectors, self.axes.get_ylim()):
+            return
+        axes_length = self.axes.get_ylim()[1] - self.axes.get_ylim()[0]
+        self.vectors.set_verts(_arrow_vertices(vectors, axes_length))
 
     def _update_figure_lines(self, lines):
         """
         updates lines
         :param lines: line objects with start and end x, y coordinates
         """
-        # delete old lines
-        for line in self.lines:
-            line[0].remove()
-        # create new lines
-        self.lines = []
-        for x, y, end_x, end_y in lines:
-            self.lines.append(self.axes.plot([x, end_x], [y, end_y], 'g--'))
-        self.points.figure.canvas.draw_idle()
-        self.fig.canvas.flush_events()
+        if not self._changed('lines', lines):
+            return
+        self.lines.set_segments(np.asarray(lines, dtype=float).reshape(-1, 2, 2))
 
     def _update_nextpoint(self, nextpoint):
         """
         updates nextpoint in plot
         :param nextpoint: x, y coordinates of next point
         """
+        if not self._changed('nextpoint', *nextpoint):
+            return
         points, color = nextpoint
         x_array, y_array = [], []
         for x, y in points:
@@ -397,20 +458,98 @@ class PlotCanvas(FigureCanvas):
             y_array.append(y)
         self.nextpoint.set_color(color)
         self.nextpoint.set_data(x_array, y_array)
-        self.nextpoint.figure.canvas.draw_idle()
-        self.fig.canvas.flush_events()
 
     def _update_lowest_point(self, lowest_points):
         """
         updates lowest_point in plot
         :param lowest_points: x, y coordinates of lowest point
         """
+        if not self._changed('lowest_point', lowest_points):
+            return
         x_array, y_array = [], []
         for x, y in lowest_points:
             x_array.append(x)
             y_array.append(y)
         self.lowest_point.set_data(x_array, y_array)
-        self.lowest_point.figure.canvas.draw_idle()
+
+############
+# Blitting #
+############
+
+    @contextmanager
+    def frame_update(self):
+        """
+        batched update transaction for one frame. Plot objects changed within are drawn with one blit
+        when the (outermost) transaction is committed, unchanged frames are not drawn at all.
+
+        example:
+            with self.frame_update():
+                self._update_figure_points(points)
+                self._update_figure_lines(lines)
+        """
+        self._update_depth += 1
+        try:
+            yield self
+        finally:
+            self._update_depth -= 1
+        if self._update_depth == 0 and (self._dirty or self.background is None):
+            self._dirty = False
+            self._blit_frame()
+
+    def _changed(self, name, *data):
+        """
+        compares the data of a plot object with the data of the last frame and stores it.
+        Marks the current update transaction as dirty if it changed
+        :param name: name of plot object
+        :param data: data the plot object is updated with
+        :return: True if data has changed since last frame
+        """
+        data = [np.array(value) for value in data]
+        last = self._frame_data.get(name)
+        if last is not None and len(last) == len(data) and all(
+                a.shape == b.shape and np.array_equal(a, b) for a, b in zip(last, data)):
+            return False
+        self._frame_data[name] = data
+        self._dirty = True
+        return True
+
+    def _on_draw(self, event):
+        """
+        called after every full draw (e.g. new limits, resize, theme change).
+        caches the freshly drawn static background and draws the animated plot objects on top of it
+        :param event: draw event object
+        """
+        self.background = self.copy_from_bbox(self.fig.bbox)
+        self._draw_animated()
+
+    def _animated_artists(self):
+        """
+        :return: list of all plot objects that are animated (i.e. not part of the background)
+        """
+        artists = [self.points, self.nextpoint, self.lowest_point, self.vectors, self.lines]
+        if self.scatter_points is not None:
+            artists.append(self.scatter_points)
+        return artists
+
+    def _draw_animated(self):
+        """
+        draws all animated plot objects on the canvas (without showing them yet)
+        """
+        for artist in self._animated_artists():
+            if artist.axes is not None:
+                self.fig.draw_artist(artist)
+
+    def _blit_frame(self):
+        """
+        shows the current frame: restores the cached background, draws the animated plot objects
+        and blits them onto the screen. Falls back to a full draw if there is no valid background
+        """
+        if self.background is None:
+            self.draw_idle()
+        else:
+            self.restore_region(self.background)
+            self._draw_animated()
+            self.blit(self.fig.bbox)
         self.fig.canvas.flush_events()
 
 #########
@@ -428,6 +567,7 @@ class PlotCanvas(FigureCanvas):
         self._update_figure_lines([])
         self.axes.set_ylim(0, 10)
         self.axes.set_xlim(-5, 5)
+        self.draw_idle()
 
     def reset_figure(self):
         """
@@ -455,6 +595,7 @@ class PlotCanvas(FigureCanvas):
 
         # init plot
         self._plot_inits()
+        self.background = None
 
 ################
 # click points #
@@ -531,36 +672,38 @@ class PlotCanvas(FigureCanvas):
         sets inital depending on funtion object and start point
         :param: startpoint: start point of calculation
         """
-        y_min, y_max, x_min, x_max = self.algorithm.ObjectiveFunction.get_axes_parameters()
+        ObjectiveFunction = self._objective_function()
+        y_min, y_max, x_min, x_max = ObjectiveFunction.get_axes_parameters()
 
-        if str(self.algorithm.ObjectiveFunction) == "Sinus" \
-                or str(self.algorithm.ObjectiveFunction) == "Torsion Potential":
+        if str(ObjectiveFunction) == "Sinus" \
+                or str(ObjectiveFunction) == "Torsion Potential":
             tmp = x_min
             x_min = startpoint - (x_max - x_min) / 2
             x_max = startpoint + (x_max - tmp) / 2
-        if str(self.algorithm.ObjectiveFunction) == "Interpolated" \
-                or str(self.algorithm.ObjectiveFunction) == "Polynomial":
+        if str(ObjectiveFunction) == "Interpolated" \
+                or str(ObjectiveFunction) == "Polynomial":
             if x_max < startpoint:
                 x_max = startpoint + 1
             elif x_min > startpoint:
                 x_min = startpoint - 1
-            if y_max < self.algorithm.ObjectiveFunction(startpoint):
-                y_max = self.algorithm.ObjectiveFunction(startpoint) + 1
-            elif y_min > self.algorithm.ObjectiveFunction(startpoint):
-                y_min = self.algorithm.ObjectiveFunction(startpoint) - 1
+            if y_max < ObjectiveFunction(startpoint):
+                y_max = ObjectiveFunction(startpoint) + 1
+            elif y_min > ObjectiveFunction(startpoint):
+                y_min = ObjectiveFunction(startpoint) - 1
 
         self.axes.set_ylim(y_min, y_max)
         self.axes.set_xlim(x_min, x_max)
 
-    def _sleep(self):
+    def _objective_function(self):
         """
-        sleep between mouse x/y coords request
-        (for better performance, rather then tracing mouse movements
-        all the time)
+        The canvas evaluates the same x values repeatedly (e.g. the start point in set_axes), unlike the
+        algorithms, which use their objective function unwrapped
+        :return: objective function of the current algorithm with cached scalar calls
         """
-        loop = QEventLoop()
-        QTimer.singleShot(self.sleep_time, loop.quit)
-        loop.exec_()
+        ObjectiveFunction = self.algorithm.ObjectiveFunction
+        if self.cached_function is None or self.cached_function.function is not ObjectiveFunction:
+            self.cached_function = cached(ObjectiveFunction)
+        return self.cached_function
 
     def _trace_current_focus(self):
         """
@@ -581,3 +724,33 @@ class PlotCanvas(FigureCanvas):
             return False
 
 
+def _arrow_vertices(vectors, axes_length):
+    """
+    calculates the outlines of arrows, shaped like matplotlib's FancyArrow (axes.arrow) with length_includes_head.
+    Long arrows get a fixed width and head length, short arrows are scaled with their length.
+    :param vectors: arrow coords from (x, y) to (x+dx, y+dy) as (n, 4) array
+    :param axes_length: length of y axis
+    :return: (n, 8, 2) array of arrow vertices (arrows of length zero are left out)
+    """
+    x, y, dx, dy = np.asarray(vectors, dtype=float).reshape(-1, 4).T
+    length = np.sqrt(dx ** 2 + dy ** 2)
+    x, y, dx, dy, length = (values[length > 0] for values in (x, y, dx, dy, length))
+
+    long_arrows = length > axes_length * 0.1
+    width = np.where(long_arrows, 0.008 * axes_length, 0.2 * length)
+    head_length = np.where(long_arrows, 0.2, 0.3 * length)
+    head_width = width * 3
+
+    # arrow along negative x axis with its tip in origin
+    zeros = np.zeros_like(length)
+    arrow_x = np.stack([zeros, -head_length, -head_length, -length,
+                        -length, -head_length, -head_length, zeros], axis=1)
+    arrow_y = np.stack([zeros, -head_width / 2, -width / 2, -width / 2,
+                        width / 2, width / 2, head_width / 2, zeros], axis=1)
+
+    # rotate in direction of (dx, dy) and move tip to (x+dx, y+dy)
+    cos = (dx / length)[:, np.newaxis]
+    sin = (dy / length)[:, np.newaxis]
+    vertices_x = arrow_x * cos - arrow_y * sin + (x + dx)[:, np.newaxis]
+    vertices_y = arrow_x * sin + arrow_y * cos + (y + dy)[:, np.newaxis]
+    return np.stack([vertices_x, vertices_y], axis=-1)
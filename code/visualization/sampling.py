@@ -0,0 +1,158 @@
+"""
+Sampling submodule.
+
+Adaptive sampling of objective function curves for the current view of plotcanvas.
+The x range is sampled on a coarse grid first, intervals whose curve deviates visibly (in pixels) from
+a straight line are then bisected until the deviation is below a tolerance or the sample budget of the
+view (proportional to its width in pixels) is used up. Grid points lie on a global lattice (multiples of
+a power of two), so values computed for one view are reused for the next one, e.g. when panning.
+"""
+
+
+########### IMPORTS ###########
+# <editor-fold desc="Open">
+
+# packages
+import numpy as np
+
+# </editor-fold>
+########### IMPORTS ###########
+
+
+class CurveSampler:
+    """
+    Adaptive curve sampler with a cache of computed function values.
+
+    example:
+        sampler = CurveSampler(ObjectiveFunction.evaluate)
+        xs, ys = sampler.sample(axes.get_xlim(), axes.get_ylim(), (axes.bbox.width, axes.bbox.height))
+    """
+    def __init__(self, function, samples_per_pixel=0.25, max_samples_per_pixel=4, tolerance=0.5, max_depth=10,
+                 cache_size=100000):
+        """
+        init
+        :param function: function that is evaluated on numpy arrays of x values
+        :param samples_per_pixel: density of coarse grid (samples per pixel of view width)
+        :param max_samples_per_pixel: sample budget (samples per pixel of view width)
+        :param tolerance: allowed deviation of curve from straight lines between samples in pixels
+        :param max_depth: maximal number of bisections of a coarse grid interval
+        :param cache_size: maximal number of cached function values
+        """
+        self.function = function
+        self.samples_per_pixel = samples_per_pixel
+        self.max_samples_per_pixel = max_samples_per_pixel
+        self.tolerance = tolerance
+        self.max_depth = max_depth
+        self.cache_size = cache_size
+        # cached function values, sorted by x
+        self.cache_x = np.empty(0)
+        self.cache_y = np.empty(0)
+        # number of function values actually computed (not taken from cache)
+        self.evaluations = 0
+
+    def sample(self, x_range, y_range, size, refine=True):
+        """
+        samples the function curve for a view
+        :param x_range: x limits of view
+        :param y_range: y limits of view
+        :param size: width and height of view in pixels
+        :param refine: if False only the coarse grid is sampled (e.g. as cheap interim curve while navigating)
+        :return: x values and y values of samples, sorted by x
+        """
+        x_min, x_max = sorted(x_range)
+        y_min, y_max = sorted(y_range)
+        width, height = max(int(size[0]), 1), max(int(size[1]), 1)
+        if not x_max > x_min:
+            return np.empty(0), np.empty(0)
+
+        # coarse grid on lattice of multiples of a power of two
+        step = 2.0 ** np.floor(np.log2((x_max - x_min) / max(width * self.samples_per_pixel, 2)))
+        xs = np.arange(np.floor(x_min / step), np.ceil(x_max / step) + 1) * step
+        ys = self.evaluate(xs)
+        if not refine:
+            return xs, ys
+
+        # deviations are measured in pixels, values far outside of view are clipped
+        y_span = y_max - y_min if y_max > y_min else 1.0
+        scale = height / y_span
+        clip = (y_min - y_span, y_max + y_span)
+
+        # estimated deviation of each interval from a straight line (second differences)
+        curvature = np.zeros(len(xs))
+        clipped = np.clip(ys, *clip)
+        curvature[1:-1] = np.abs(clipped[:-2] - 2 * clipped[1:-1] + clipped[2:]) * scale / 2
+        deviation = _finite(np.maximum(curvature[:-1], curvature[1:]))
+        refine = deviation > self.tolerance
+
+        budget = int(self.max_samples_per_pixel * width)
+        for depth in range(self.max_depth):
+            candidates = np.flatnonzero(refine)
+            room = budget - len(xs)
+            if not len(candidates) or room <= 0:
+                break
+            if len(candidates) > room:
+                # intervals with largest deviation first
+                candidates = np.sort(candidates[np.argsort(deviation[candidates])[::-1][:room]])
+
+            # bisect candidates
+            x_mid = (xs[candidates] + xs[candidates + 1]) / 2
+            y_mid = self.evaluate(x_mid)
+            chord = (np.clip(ys[candidates], *clip) + np.clip(ys[candidates + 1], *clip)) / 2
+            mid_deviation = _finite(np.abs(np.clip(y_mid, *clip) - chord) * scale)
+            xs = np.insert(xs, candidates + 1, x_mid)
+            ys = np.insert(ys, candidates + 1, y_mid)
+
+            # both halves of a bisected interval are checked again if its midpoint deviated
+            first_halves = candidates + np.arange(len(candidates))
+            deviation = np.zeros(len(xs) - 1)
+            deviation[first_halves] = deviation[first_halves + 1] = mid_deviation
+            refine = deviation > self.tolerance
+
+        return xs, ys
+
+    def evaluate(self, xs):
+        """
+        evaluates function, values are taken from cache if computed before
+        :param xs: numpy array of x values
+        :return: numpy array of y values
+        """
+        index = np.minimum(np.searchsorted(self.cache_x, xs), max(len(self.cache_x) - 1, 0))
+        cached = (self.cache_x[index] == xs) if len(self.cache_x) else np.zeros(len(xs), dtype=bool)
+        ys = np.empty(len(xs))
+        ys[cached] = self.cache_y[index[cached]]
+        missing = ~cached
+        if missing.any():
+            # e.g. poles of a function on the lattice (x = 0) must not spam warnings
+            with np.errstate(divide='ignore', invalid='ignore', over='ignore'):
+                ys[missing] = self.function(xs[missing])
+            self.evaluations += int(missing.sum())
+            self._store(xs[missing], ys[missing])
+        return ys
+
+    def clear(self):
+        """
+        removes all cached function values
+        """
+        self.cache_x = np.empty(0)
+        self.cache_y = np.empty(0)
+
+    def _store(self, xs, ys):
+        """
+        adds function values to cache. The cache is restarted if it gets too large
+        :param xs: x values (not in cache yet)
+        :param ys: their function values
+        """
+        if len(self.cache_x) + len(xs) > self.cache_size:
+            self.clear()
+        cache_x = np.concatenate([self.cache_x, xs])
+        cache_y = np.concatenate([self.cache_y, ys])
+        cache_x, unique = np.unique(cache_x, return_index=True)
+        self.cache_x, self.cache_y = cache_x, cache_y[unique]
+
+
+def _finite(deviation):
+    """
+    :param deviation: deviations in pixels
+    :return: deviations with non finite values (where the curve can not be drawn anyway) set to zero
+    """
+    return np.where(np.isfinite(deviation), deviation, 0.0)
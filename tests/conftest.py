@@ -0,0 +1,21 @@
+"""
+pytest configuration.
+The packages in code/ import each other as top level packages (e.g. 'from optimization import Algorithms'),
+as main.py is started from code/. code/ is therefore put on sys.path, so tests import them the same way.
+"""
+
+
+########### IMPORTS ###########
+#<editor-fold desc="Open">
+
+# packages
+import os
+import sys
+
+#</editor-fold>
+########### IMPORTS ###########
+
+
+CODE_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'code')
+if CODE_DIR not in sys.path:
+    sys.path.insert(0, CODE_DIR)
@@ -0,0 +1,56 @@
+import os
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+# PyQt5 has to be imported before the gui package, which expects sip to be loaded
+from PyQt5 import QtGui
+from gui import latex
+
+
+class TestLatexCache():
+
+    def setup_method(self):
+        latex.clear_cache()
+
+    def test_cache_hits(self):
+        image = latex.mathtex_to_qimage("$x^2$")
+        again = latex.mathtex_to_qimage("$x^2$")
+        latex.mathtex_to_qimage("$x^2$", normal_theme=False)
+        assert(image == again)
+        info = latex.cache_info()
+        assert(info.hits == 1 and info.misses == 2 and info.currsize == 2)
+
+    def test_rendered_meanwhile_is_hit(self, monkeypatch):
+        class RenderedMeanwhile:
+            # another thread renders the formula while this one waits for the render lock
+            def __enter__(self):
+                latex._cache[("$y$", 10, True)] = latex._render_mathtex("$y$", 10, True)
+
+            def __exit__(self, *args):
+                pass
+
+        monkeypatch.setattr(latex, "_render_lock", RenderedMeanwhile())
+        latex.mathtex_to_qimage("$y$")
+        info = latex.cache_info()
+        assert(info.hits == 1 and info.misses == 0)
+
+    def test_lru_bound(self, monkeypatch):
+        monkeypatch.setattr(latex, "CACHE_SIZE", 2)
+        for tex in ("$a$", "$b$", "$a$", "$c$"):
+            latex.mathtex_to_qimage(tex)
+        assert(list(key[0] for key in latex._cache) == ["$a$", "$c$"])
+
+    def test_save_and_load(self, tmp_path):
+        image = latex.mathtex_to_qimage("$\\delta f(x)$", fontsize=8)
+        path = str(tmp_path / "cache.npz")
+        latex.save_cache(path)
+        latex.clear_cache()
+        assert(latex.load_cache(path) == 1)
+        assert(latex.mathtex_to_qimage("$\\delta f(x)$", fontsize=8) == image)
+        assert(latex.cache_info().hits == 1)
+
+    def test_prerender(self):
+        images = latex.prerender_mathtex(["$a$", "$b$"], fontsize=8).result()
+        assert(len(images) == 2 and latex.cache_info().misses == 2)
+        assert(latex.mathtex_to_qimage("$b$", fontsize=8) == images[1])
+        assert(latex.cache_info().hits == 1)
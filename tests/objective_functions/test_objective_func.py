@@ -0,0 +1,118 @@
+import pickle
+
+import numpy as np
+import pytest
+
+from objective_functions import ObjectiveFunctions, CachedObjectiveFunction, cached
+
+
+def create_function(name):
+    """
+    :param name: key of objective function in ObjectiveFunctions
+    :returns: objective function object with default coefficients (some points for interpolated)
+    """
+    function_object = ObjectiveFunctions[name]
+    if name == "Interpolated":
+        return function_object([(0.0, 1.0), (3.0, 2.0), (1.0, 0.0), (2.0, 2.5)])
+    return function_object(function_object.get_coeffs_defaults(function_object))
+
+
+class TestObjectiveFunctions():
+
+    def test_batch_matches_scalar(self):
+        xs = np.linspace(0.5, 3.0, 24).reshape(2, 3, 4)
+        for name in ObjectiveFunctions:
+            function = create_function(name)
+            ys = function.evaluate(xs)
+            gradients = function.gradient(xs)
+            assert(ys.shape == xs.shape and gradients.shape == xs.shape)
+            assert(np.allclose(ys.flat, [function(float(x)) for x in xs.flat]))
+            assert(np.allclose(gradients.flat, [function(float(x), True) for x in xs.flat]))
+
+    def test_value_and_grad(self):
+        xs = np.linspace(0.5, 3.0, 7)
+        for name in ObjectiveFunctions:
+            function = create_function(name)
+            for x in (1.3, xs):
+                value, slope = function.value_and_grad(x)
+                assert(np.array_equal(value, function(x)) and np.array_equal(slope, function(x, True)))
+
+    def test_evaluate_scalar_and_list(self):
+        for name in ObjectiveFunctions:
+            function = create_function(name)
+            assert(function.evaluate(1.5).shape == ())
+            assert(np.allclose(function.evaluate([1.5, 2.5]), [function(1.5), function(2.5)]))
+
+    def test_polynomial(self):
+        function = ObjectiveFunctions["Polynomial"]([1, -2, 0, 3])
+        assert(np.allclose(function.evaluate([0, 1, 2]), [1, 2, 21]))
+        assert(np.allclose(function.gradient([0, 1, 2]), [-2, 7, 34]))
+
+    def test_interpolated_spline_cached(self):
+        function = create_function("Interpolated")
+        spline = function.spline
+        function(1.5)
+        function(1.5, True)
+        assert(function.spline is spline)
+        assert([x for x, _ in function.coeff] == [0.0, 1.0, 2.0, 3.0])
+        function.coeff = [(0.0, 0.0), (1.0, 1.0), (2.0, 2.0)]
+        assert(function.spline is not spline)
+        assert(np.isclose(function(1.5), 1.5))
+        with pytest.raises(AttributeError):
+            function.coeff.append((3.0, 3.0))
+        with pytest.raises(ValueError):
+            type(function)([(0.0, 0.0)])
+
+    def test_picklable(self):
+        xs = np.linspace(0.5, 3.0, 7)
+        for name in ObjectiveFunctions:
+            function = create_function(name)
+            copy = pickle.loads(pickle.dumps(function))
+            assert(np.array_equal(copy.evaluate(xs), function.evaluate(xs)))
+
+
+class TestCachedObjectiveFunction():
+
+    def test_hits_and_misses(self):
+        function = create_function("Lennard Jones Pot.")
+        wrapped = CachedObjectiveFunction(function)
+        assert(wrapped(1.5) == function(1.5) and wrapped(1.5, True) == function(1.5, True))
+        assert(wrapped(1.5) == function(1.5))
+        assert(wrapped.tangent_y(1.5, wrapped(1.5), 2.0) == function.tangent_y(1.5, function(1.5), 2.0))
+        info = wrapped.cache_info()
+        assert(info.misses == 2 and info.hits == 3 and info.currsize == 2)
+        assert(wrapped.value_and_grad(1.5) == function.value_and_grad(1.5))
+        assert(wrapped.value_and_grad(2.5) == function.value_and_grad(2.5) and wrapped(2.5, True) == function(2.5, True))
+        info = wrapped.cache_info()
+        assert(info.misses == 4 and info.hits == 6 and info.currsize == 4)
+
+    def test_eviction(self):
+        wrapped = CachedObjectiveFunction(create_function("Sinus"), maxsize=3)
+        for x in (1.0, 2.0, 3.0, 1.0, 4.0):
+            wrapped(x)
+        assert(wrapped.cache_info().currsize == 3)
+        wrapped(1.0)
+        wrapped(2.0)
+        assert(wrapped.cache_info().hits == 2)
+
+    def test_transparent(self):
+        function = create_function("Torsion Pot.")
+        wrapped = cached(function)
+        xs = np.linspace(-3, 3, 5)
+        assert(cached(wrapped) is wrapped and str(wrapped) == str(function))
+        assert(np.array_equal(wrapped(xs), function(xs)) and wrapped.cache_info().misses == 0)
+        assert(np.array_equal(wrapped.gradient(xs), function.gradient(xs)))
+        assert(wrapped.get_axes_parameters() == function.get_axes_parameters())
+        wrapped(1.0)
+        copy = pickle.loads(pickle.dumps(wrapped))
+        assert(copy(1.0) == wrapped(1.0) and copy.cache_info().misses == 1)
+
+    def test_coeff_changes_clear_cache(self):
+        function = create_function("Polynomial")
+        wrapped = CachedObjectiveFunction(function)
+        wrapped(1.0)
+        wrapped.coeff = [1.0, 2.0, 3.0]
+        assert(function.coeff == [1.0, 2.0, 3.0] and "coeff" not in wrapped.__dict__)
+        assert(wrapped(1.0) == 6.0)
+        function.coeff = [0.0, 1.0]
+        assert(wrapped(1.0) == 1.0 and wrapped(1.0, True) == 1.0)
@@ -0,0 +1,66 @@
+import itertools
+import numpy as np
+
+from optimization import GradientDescent, SimulatedAnnealing
+from objective_functions import Sinus, SimCrash
+
+
+class TestGradientDescent():
+
+    def test_lanes_match_single_runs(self):
+        function = Sinus([1, 1, 1, 1])
+        startpoints = [-2.0, 0.5, 2.0, 6.0]
+        lanes = GradientDescent(function, [0.1, 300]).create_lanes(np.array(startpoints))
+        for lane, startpoint in enumerate(startpoints):
+            algorithm = GradientDescent(function, [0.1, 300])
+            algorithm.create_array(startpoint)
+            xs, ys = lanes.trajectory(lane)
+            assert(len(xs) == (len(algorithm.array) - 1) // 3 + 1)
+            assert(np.allclose(algorithm.array[-1].points, [[xs[-1], ys[-1]]]))
+        assert(lanes.converged.all())
+        assert(sum(basin.count for basin in lanes.basins()) == len(startpoints))
+
+    def test_progress_and_cancel(self):
+        algorithm = GradientDescent(Sinus([1, 1, 1, 1]), [0.1, 300])
+        algorithm.create_array(2.0)
+        assert(algorithm.progress == 1.0)
+        cancelled = GradientDescent(Sinus([1, 1, 1, 1]), [0.1, 300])
+        cancelled.cancel()
+        cancelled.create_array(2.0)
+        assert(len(cancelled.array) == 1 and cancelled.progress == 0.0)
+
+    def test_objective_function_unwrapped(self):
+        # every step evaluates a new x, a cache would only cost lookups
+        function = Sinus([1, 1, 1, 1])
+        assert(GradientDescent(function, [0.1, 300]).ObjectiveFunction is function)
+
+    def test_stops_at_capacity(self):
+        algorithm = GradientDescent(Sinus([1, 1, 1, 1]), [0.1, 0])
+        algorithm.create_array(2.0)
+        assert(len(algorithm.array) == 1 and algorithm.array[0].pseudocodeline == 2)
+        assert(algorithm.progress == 1.0 and not algorithm.truncated)
+        truncated = GradientDescent(Sinus([1, 1, 1, 1]), [0.1, 300])
+        truncated.buffer_array_length = 5
+        truncated.create_array(2.0)
+        assert(len(truncated.array) == 5 and truncated.truncated and truncated.progress == 1.0)
+
+    def test_iter_frames(self):
+        algorithm = GradientDescent(Sinus([1, 1, 1, 1]), [0.1, 300])
+        frames = list(itertools.islice(algorithm.iter_frames(2.0), 4))
+        assert([frame.pseudocodeline for frame in frames] == [2, 3, 4, 6])
+        assert(algorithm.progress == 0.0)
+        algorithm.create_array(2.0)
+        assert(len(list(algorithm.iter_frames(2.0))) == len(algorithm.array))
+
+
+class TestSimulatedAnnealing():
+
+    def test_chains(self):
+        params = [100, 1.0, 40, 0.8]
+        chains = SimulatedAnnealing(SimCrash(0), params).create_chains(3.0, 3, seed=7, max_workers=2)
+        again = SimulatedAnnealing(SimCrash(0), params).create_chains(3.0, 3, seed=7, max_workers=2)
+        assert(chains.best_points == again.best_points)
+        assert(len(chains.chain_offsets) == 3 and chains.chain_offsets[0] == 0)
+        assert(chains.best_point == min(chains.best_points, key=lambda point: point[1]))
+        assert(chains.array[int(chains.chain_offsets[1])].points.tolist() == [[3.0, SimCrash(0)(3.0)]])
+        assert(chains.array[-1].scatterpoints_position == len(chains.array.scatterpoint_array))
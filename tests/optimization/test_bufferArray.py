@@ -1,4 +1,6 @@
-from code.optimization.bufferArray import BufferArray
+import pytest
+
+from optimization.bufferArray import BufferArray
 
 class TestBufferArray():
     
@@ -6,3 +8,90 @@ class TestBufferArray():
         self.bufferArray = BufferArray(1)
         self.bufferArray.push(1,None,None,None)
         assert(len(self.bufferArray)==1)
+
+   def test_columns(self):
+        self.bufferArray = BufferArray(3)
+        self.bufferArray.push(2, [(1.0, 4.0)], None, None)
+        self.bufferArray.push(4, [(2.0, 3.0)], [(1.0, 4.0, 1.0, -1.0)],
+                              [(1.0, 4.0, 0.0, 5.0), (1.0, 4.0, 2.0, 3.0)])
+        self.bufferArray.push(5, [(2.0, 3.0)], None, None, nextpoint=[[(3.0, 5.0)], 'red'])
+        assert(self.bufferArray[0].vectors is None)
+        assert(self.bufferArray[1].pseudocodeline == 4)
+        assert(self.bufferArray[1].vectors.tolist() == [[1.0, 4.0, 1.0, -1.0]])
+        assert(self.bufferArray[1].lines.shape == (2, 4))
+        assert(self.bufferArray[2].lines is None)
+        assert(self.bufferArray[2].points.tolist() == [[2.0, 3.0]])
+        points, color = self.bufferArray[2].nextpoint
+        assert(points.tolist() == [[3.0, 5.0]] and color == 'red')
+
+   def test_call_is_view(self):
+        self.bufferArray = BufferArray(2)
+        self.bufferArray.push(1, [(1.0, 2.0)], None, None)
+        self.bufferArray.push(3, [(0.5, 1.0)], None, None)
+        self.bufferArray.set_last_position()
+        assert(self.bufferArray().pseudocodeline == 3)
+        assert(self.bufferArray(-1).pseudocodeline == 1)
+        assert(self.bufferArray().points.base is not None)
+
+   def test_growth(self):
+        self.bufferArray = BufferArray(2)
+        for i in range(100):
+            self.bufferArray.push(i % 5, [(i, -i)], [(i, -i, 1, 1)], None)
+        assert(len(self.bufferArray) == 100)
+        assert(self.bufferArray.capacity >= 100)
+        assert(self.bufferArray[99].vectors.tolist() == [[99, -99, 1, 1]])
+        self.bufferArray.trim()
+        assert(self.bufferArray.capacity == 100)
+        assert(self.bufferArray[0].points.tolist() == [[0, 0]])
+
+   def test_max_capacity(self):
+        self.bufferArray = BufferArray(2, max_capacity=3)
+        for i in range(3):
+            self.bufferArray.push(1, None, None, None)
+        with pytest.raises(IndexError):
+            self.bufferArray.push(1, None, None, None)
+        assert(len(self.bufferArray) == 3)
+
+   def test_lowest_point(self):
+        self.bufferArray = BufferArray(2)
+        assert(self.bufferArray.get_minimum() is None)
+        self.bufferArray.push(1, None, None, None)
+        for y in (3.0, 1.0, 2.0, 0.5, 4.0):
+            self.bufferArray.push(1, [(y * 2, y)], None, None)
+        assert(self.bufferArray[0].lowest_point is None)
+        assert([entry.lowest_point[0, 1] for entry in list(self.bufferArray)[1:]] == [3.0, 1.0, 1.0, 0.5, 0.5])
+        assert(self.bufferArray.get_minimum() == (1.0, 0.5))
+        assert(self.bufferArray.minimum == 4)
+        assert(self.bufferArray.lowest_count == 3)
+
+   def test_lowest_point_skips_non_finite(self):
+        self.bufferArray = BufferArray(2)
+        for y in (float('nan'), 3.0, float('-inf'), 1.0, float('nan'), 2.0):
+            self.bufferArray.push(1, [(y, y)], None, None)
+        assert(self.bufferArray[0].lowest_point is None)
+        assert(self.bufferArray.get_minimum() == (1.0, 1.0))
+        assert(self.bufferArray.minimum == 3)
+
+   def test_scatter_points(self):
+        self.bufferArray = BufferArray(2)
+        for i in range(40):
+            self.bufferArray.push(1, [(i, i)], None, None, scatter=[(i, -i, i / 10)] if i % 2 else None)
+        assert(self.bufferArray[-1].scatterpoints_position == 20)
+        scatter_points = self.bufferArray.scatterpoint_array
+        assert(scatter_points.shape == (20, 3))
+        assert(scatter_points.base is self.bufferArray.scatter_data)
+        assert(scatter_points[:self.bufferArray[5].scatterpoints_position, 0].tolist() == [1, 3, 5])
+
+   def test_merge_scatter_per_chain(self):
+        chains = []
+        for chain in range(3):
+            bufferArray = BufferArray(2)
+            for i in range(4):
+                bufferArray.push(1, [(chain, i)], None, None, scatter=[(chain, i, i)])
+            chains.append(bufferArray)
+        merged = BufferArray.merge(chains)
+        frame = merged[9]
+        assert((frame.scatterpoints_start, frame.scatterpoints_position) == (8, 10))
+        scatter_points = merged.scatterpoint_array[frame.scatterpoints_start:frame.scatterpoints_position]
+        assert(scatter_points[:, 0].tolist() == [2, 2])
+        assert(merged[3].scatterpoints_start == 0)
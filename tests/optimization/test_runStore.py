@@ -0,0 +1,60 @@
+import numpy as np
+import pytest
+
+from optimization import SimulatedAnnealing
+from optimization.bufferArray import BufferArray
+from optimization.runStore import save_run, load_run, load_header
+from objective_functions import Sinus
+
+
+class TestRunStore():
+
+    def test_save_and_load(self, tmp_path):
+        algorithm = SimulatedAnnealing(Sinus([1, 1, 1, 1]), [100, 0.5, 10, 0.9], seed=3)
+        algorithm.create_array(2)
+        path = str(tmp_path / "run.noviz")
+        save_run(path, algorithm.array, "Sinus", [1, 1, 1, 1], "Simulated Annealing", [100, 0.5, 10, 0.9], 2, 3)
+        for mmap in (True, False):
+            header, array = load_run(path, mmap=mmap)
+            assert(header["method"] == "Simulated Annealing" and header["seed"] == 3)
+            assert(len(array) == len(algorithm.array))
+            for name, column in algorithm.array.columns().items():
+                assert(np.array_equal(array.columns()[name], column, equal_nan=True))
+            assert(array.get_minimum() == algorithm.array.get_minimum())
+            assert(array.minimum == algorithm.array.minimum)
+            assert(array[-1].points.tolist() == algorithm.array[-1].points.tolist())
+            assert(array[-1].scatterpoints_position == algorithm.array[-1].scatterpoints_position)
+        assert(isinstance(load_run(path)[1].points, np.memmap))
+
+    def test_save_loaded_run_to_own_path(self, tmp_path):
+        algorithm = SimulatedAnnealing(Sinus([1, 1, 1, 1]), [100, 0.5, 10, 0.9], seed=3)
+        algorithm.create_array(2)
+        path = str(tmp_path / "run.noviz")
+        save_run(path, algorithm.array, "Sinus", [1, 1, 1, 1], "Simulated Annealing", [100, 0.5, 10, 0.9], 2, 3)
+        header, array = load_run(path)
+        save_run(path, array, "Sinus", [1, 1, 1, 1], "Simulated Annealing", [100, 0.5, 10, 0.9], 2, 3)
+        # the saved array does not map the replaced file anymore
+        assert(not isinstance(array.points, np.memmap))
+        assert(array[-1].points.tolist() == algorithm.array[-1].points.tolist())
+        other_path = str(tmp_path / "other.noviz")
+        header, array = load_run(path)
+        save_run(other_path, array, "Sinus", [1, 1, 1, 1], "Simulated Annealing", [100, 0.5, 10, 0.9], 2, 3)
+        assert(isinstance(array.points, np.memmap))
+        header, array = load_run(other_path)
+        for name, column in algorithm.array.columns().items():
+            assert(np.array_equal(array.columns()[name], column, equal_nan=True))
+        assert(sorted(file.name for file in tmp_path.iterdir()) == ["other.noviz", "run.noviz"])
+
+    def test_empty_columns(self, tmp_path):
+        buffer_array = BufferArray()
+        buffer_array.push(1, [(1.0, 2.0)], None, None)
+        path = str(tmp_path / "run.noviz")
+        save_run(path, buffer_array, "Sinus", [1, 1, 1, 1], "Gradient Descent", [0.1, 10], 1)
+        header, array = load_run(path)
+        assert(array[0].vectors is None and array[0].points.tolist() == [[1.0, 2.0]])
+
+    def test_no_run_file(self, tmp_path):
+        path = tmp_path / "run.noviz"
+        path.write_bytes(b"no run file")
+        with pytest.raises(ValueError):
+            load_header(str(path))
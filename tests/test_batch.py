@@ -0,0 +1,36 @@
+import json
+import numpy as np
+import pytest
+
+from batch import Batch, main
+from optimization.runStore import load_run
+
+
+class TestBatch():
+
+    def test_run_writes_results(self, tmp_path):
+        main(["--function", "Bond Angle Pot.", "--method", "Gradient Descent", "--params", "0.1", "50",
+              "--startpoints", "0", "4", "--output", str(tmp_path)])
+        with open(tmp_path / "summary.json") as file:
+            summary = json.load(file)
+        assert(summary["method"] == "Gradient Descent" and len(summary["runs"]) == 2)
+        header, array = load_run(str(tmp_path / summary["runs"][1]["file"]))
+        assert(len(array) == summary["runs"][1]["frames"] and header["startpoint"] == 4)
+        assert(summary["runs"][1]["truncated"] is False)
+
+    def test_interpolated_coeffs(self):
+        batch = Batch("Interpolated", [0, 1, 1, 0, 2, 2], "Gradient Descent", None)
+        assert(batch.coeffs == [(0, 1), (1, 0), (2, 2)])
+        assert(batch.run([1.5])[0]["frames"] > 1)
+        with pytest.raises(ValueError):
+            Batch("Interpolated", [0, 1, 1, 0, 2], "Gradient Descent", None)
+        with pytest.raises(SystemExit):
+            main(["--function", "Interpolated", "--coeffs", "0", "1", "1", "--method", "Gradient Descent"])
+
+    def test_seeded_runs(self):
+        state = np.random.get_state()[1].copy()
+        batch = Batch("Sinus", None, "Simulated Annealing", None, seed=5)
+        first, second = batch.run([1.0, 1.0])
+        assert(first == second)
+        # own random generator, the global np.random state is not touched
+        assert((np.random.get_state()[1] == state).all())
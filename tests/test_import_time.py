@@ -0,0 +1,28 @@
+import json
+import os
+import subprocess
+import sys
+
+# seconds a cold import of the compute core (numpy included) may take
+IMPORT_BUDGET = 1.5
+# packages that must not be imported by the compute core
+HEAVY_PACKAGES = ('PyQt5', 'matplotlib', 'scipy')
+
+CODE_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'code')
+SCRIPT = """
+import json, sys, time
+start = time.perf_counter()
+import optimization, objective_functions
+duration = time.perf_counter() - start
+print(json.dumps({'duration': duration, 'packages': sorted({name.split('.')[0] for name in sys.modules})}))
+"""
+
+
+class TestImportTime():
+
+    def test_cold_import(self):
+        output = subprocess.run([sys.executable, '-c', SCRIPT], cwd=CODE_DIR, check=True,
+                                stdout=subprocess.PIPE, universal_newlines=True).stdout
+        result = json.loads(output)
+        assert(not set(HEAVY_PACKAGES) & set(result['packages']))
+        assert(result['duration'] < IMPORT_BUDGET)
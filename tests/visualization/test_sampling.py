@@ -0,0 +1,37 @@
+import numpy as np
+
+from visualization.sampling import CurveSampler
+from objective_functions import Sinus, LennardJonesPotential
+
+
+class TestCurveSampler():
+
+    def test_deviation_below_tolerance(self):
+        function = Sinus([1, 1, 1, 1])
+        xs, ys = CurveSampler(function.evaluate).sample((-10, 10), (-3, 3), (800, 600))
+        assert(np.all(np.diff(xs) > 0) and xs[0] <= -10 and xs[-1] >= 10)
+        dense = np.linspace(-10, 10, 100001)
+        error = np.max(np.abs(np.interp(dense, xs, ys) - function.evaluate(dense))) * 600 / 6
+        assert(error < 0.5)
+        assert(len(xs) < 800)
+
+    def test_budget(self):
+        function = LennardJonesPotential(LennardJonesPotential.get_coeffs_defaults(LennardJonesPotential))
+        sampler = CurveSampler(function.evaluate, max_samples_per_pixel=1)
+        xs, ys = sampler.sample((0, 3), (-2, 2), (300, 200))
+        assert(len(xs) <= 300)
+
+    def test_cache_reused_on_pan(self):
+        sampler = CurveSampler(Sinus([1, 1, 1, 1]).evaluate)
+        sampler.sample((0, 8), (-2, 2), (400, 300))
+        evaluations = sampler.evaluations
+        xs, ys = sampler.sample((1, 9), (-2, 2), (400, 300))
+        assert(sampler.evaluations - evaluations < len(xs) / 4)
+        assert(np.allclose(sampler.evaluate(xs), ys))
+
+    def test_interim_is_coarse_grid(self):
+        sampler = CurveSampler(Sinus([1, 1, 1, 1]).evaluate, samples_per_pixel=0.02)
+        coarse_x, coarse_y = sampler.sample((-10, 10), (-3, 3), (800, 600), refine=False)
+        xs, ys = sampler.sample((-10, 10), (-3, 3), (800, 600))
+        assert(len(coarse_x) < len(xs))
+        assert(np.all(np.isin(coarse_x, xs)))